@@ -1,12 +1,41 @@
-from flask import Flask, render_template, request
+from flask import Flask, render_template, request, jsonify, Response, make_response
+import functools
+import hmac
 import os 
 import numpy as np
 import pandas as pd
-from ml_project.pipeline.prediction import PredictionPipeline
+from ml_project.pipeline.multi_model_prediction import load_multi_model_pipeline
+from ml_project.config.configuration import ConfigurationManager
+from ml_project.components.drift_monitor import DriftMonitor
+from ml_project.components.prediction_log import PredictionLogger
+from ml_project.components.shadow_recorder import ShadowRecorder
+from ml_project.components.explainer import load_explainer
+from ml_project.utils.profiling import Profiler
 
 
 app = Flask(__name__) # initializing a flask app
 
+config_manager = ConfigurationManager()
+
+serving_config = config_manager.get_serving_config()
+explainer_config = config_manager.get_explainer_config()
+
+# feature order of the raw binary endpoint, as declared in schema.yaml
+FEATURE_COLUMNS = serving_config.feature_columns
+RAW_DTYPES = {'float64': np.dtype('<f8'), 'float32': np.dtype('<f4')}
+
+# online drift monitor, compared against the training statistics on a background thread
+drift_monitor = DriftMonitor(config=config_manager.get_drift_monitor_config())
+drift_monitor.start()
+
+# audit log of every served prediction, written in batches by a background thread
+prediction_log = PredictionLogger(config=config_manager.get_prediction_log_config())
+prediction_log.start()
+
+# comparison of shadow and A/B models against the served predictions, off the request path
+shadow_recorder = ShadowRecorder(config=serving_config)
+shadow_recorder.start()
+
 @app.route('/',methods=['GET'])  # route to display the home page
 def homePage():
     return render_template("index.html")
@@ -39,9 +68,12 @@ def index():
             data = [fixed_acidity,volatile_acidity,citric_acid,residual_sugar,chlorides,
                     free_sulfur_dioxide,total_sulfur_dioxide,density,pH,sulphates,alcohol]
             data = np.array(data).reshape(1, 11)
+            drift_monitor.observe(data)
             
-            obj = PredictionPipeline()
-            predict = obj.predict(data)
+            obj = load_multi_model_pipeline(serving_config)
+            predict, arms, scores = obj.predict(data)
+            shadow_recorder.record(scores, arms)
+            prediction_log.log(data, predict, obj.model_versions[arms])
 
             return render_template('results.html', prediction = str(predict))
 
@@ -53,6 +85,152 @@ def index():
         return render_template('index.html')
 
 
+def read_raw_rows():
+    """
+    Decodes a body of n_rows x 11 packed little-endian floats in schema.yaml column order
+    into a matrix without copying. The row count comes from the body length and is checked
+    against the optional X-Rows header. Returns the matrix and None, or None and an error.
+    """
+    dtype = RAW_DTYPES.get(request.args.get('dtype', 'float64'))
+    if dtype is None:
+        return None, ('dtype must be one of: ' + ', '.join(RAW_DTYPES), 400)
+
+    body = request.get_data(cache=False)
+    row_size = dtype.itemsize * len(FEATURE_COLUMNS)
+    if not body or len(body) % row_size:
+        return None, (f'body must be a non-empty multiple of {row_size} bytes', 400)
+    n_rows = len(body) // row_size
+    if 'X-Rows' in request.headers and request.headers.get('X-Rows', type=int) != n_rows:
+        return None, (f'X-Rows does not match the {n_rows} rows in the body', 400)
+
+    return np.frombuffer(body, dtype=dtype).reshape(n_rows, len(FEATURE_COLUMNS)), None
+
+
+def check_finite(data):
+    """
+    Returns an error naming the rows that hold NaN or Inf, or None when every value is
+    finite. Such rows would give NaN predictions and skew the drift statistics.
+    """
+    finite = np.isfinite(data).all(axis=1)
+    if finite.all():
+        return None
+    bad = np.flatnonzero(~finite)
+    return f'rows must hold finite values only, got NaN or Inf in rows {bad[:10].tolist()}', 400
+
+
+@app.route('/predict/raw',methods=['POST'])  # route to score packed little-endian float rows
+def predict_raw():
+    data, error = read_raw_rows()
+    if error:
+        return error
+    error = check_finite(data)
+    if error:
+        return error
+    drift_monitor.observe(data)
+
+    obj = load_multi_model_pipeline(serving_config)
+    predict, arms, scores = obj.predict(data)
+    shadow_recorder.record(scores, arms)
+    prediction_log.log(data, predict, obj.model_versions[arms])
+
+    return Response(predict.astype(data.dtype, copy=False).tobytes(),
+                    mimetype='application/octet-stream', headers={'X-Rows': str(len(data))})
+
+
+@app.route('/explain',methods=['POST'])  # route to explain predictions by feature contribution
+def explain():
+    # rows come as JSON {"rows": [[11 values], ...]} or as a packed body like /predict/raw;
+    # top_k (query or JSON) limits each row to its largest contributions, 0 returns all
+    top_k = request.args.get('top_k', explainer_config.default_top_k)
+    if request.mimetype == 'application/octet-stream':
+        data, error = read_raw_rows()
+        if error:
+            return error
+    else:
+        payload = request.get_json(silent=True)
+        if not isinstance(payload, dict):
+            return 'body must be a JSON object or packed rows', 400
+        top_k = payload.get('top_k', top_k)
+        try:
+            data = np.asarray(payload['rows'], dtype=np.float64)
+        except (KeyError, TypeError, ValueError):
+            data = None
+        # a flat list is not reshaped, its values could belong to any number of rows
+        if data is None or data.ndim != 2 or data.shape[1] != len(FEATURE_COLUMNS):
+            return f'JSON body must hold "rows", a list of rows of {len(FEATURE_COLUMNS)} values each', 400
+    error = check_finite(data)
+    if error:
+        return error
+    try:
+        top_k = min(max(int(top_k), 0), len(FEATURE_COLUMNS))
+    except (TypeError, ValueError):
+        return 'top_k must be an integer', 400
+
+    obj = load_multi_model_pipeline(serving_config)
+    name = request.args.get('model', obj.names[0])
+    if name not in obj.names:
+        return f'unknown model: {name}', 400
+    try:
+        explainer = load_explainer(explainer_config, obj.pipelines[obj.names.index(name)])
+    except FileNotFoundError:
+        return 'explanations are unavailable until the training feature statistics exist', 503
+
+    contributions = explainer.contributions(data)
+    result = {
+        'model': name,
+        'baseline': explainer.baseline,
+        'predictions': (explainer.baseline + contributions.sum(axis=1)).tolist(),
+    }
+    if top_k > 0:
+        index, values = explainer.top_k(contributions, top_k)
+        result['top_features'] = np.asarray(FEATURE_COLUMNS)[index].tolist()
+        result['top_contributions'] = values.tolist()
+    else:
+        result['features'] = FEATURE_COLUMNS
+        result['contributions'] = contributions.tolist()
+    return jsonify(result)
+
+
+@app.route('/models',methods=['GET'])  # route to show the served models and shadow comparison
+def models():
+    obj = load_multi_model_pipeline(serving_config)
+    return jsonify({
+        'models': [{'name': name, 'version': version.decode(), 'traffic_share': float(weight)}
+                   for name, version, weight in zip(obj.names, obj.model_versions, obj.weights)],
+        'comparison': shadow_recorder.report(),
+    })
+
+
+@app.route('/drift',methods=['GET'])  # route to show the latest feature drift report
+def drift():
+    return jsonify(drift_monitor.report())
+
+
+# admin-only profiling of prediction requests: with ML_PROJECT_PROFILE_TOKEN set on the
+# server, a request carrying that token in the X-Profile header or the ?profile= query is
+# profiled into artifacts/profiles/; without the token the views are not even wrapped
+PROFILE_TOKEN = os.environ.get('ML_PROJECT_PROFILE_TOKEN')
+
+def profiled(view):
+    profiling_config = config_manager.get_profiling_config()
+
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        token = request.headers.get('X-Profile') or request.args.get('profile')
+        if token is None or not hmac.compare_digest(token.encode(), PROFILE_TOKEN.encode()):
+            return view(*args, **kwargs)
+        with Profiler(request.path, profiling_config) as profiler:
+            response = make_response(view(*args, **kwargs))
+        if profiler.active:
+            response.headers['X-Profile-Id'] = profiler.name
+        return response
+    return wrapper
+
+if PROFILE_TOKEN:
+    for endpoint in ('index', 'predict_raw'):
+        app.view_functions[endpoint] = profiled(app.view_functions[endpoint])
+
+
 if __name__ == "__main__":
 	app.run(host="0.0.0.0", port = 5000, debug=True)
 	# app.run(host="0.0.0.0", port = 8080)
\ No newline at end of file
@@ -0,0 +1,51 @@
+"""
+Measures how cross-validation wall time scales with the number of worker processes.
+
+Prepares the memory-mapped dataset once (optionally replicated to make each fold
+heavier) and runs the folds with an increasing number of workers.
+
+Usage:
+    python benchmarks/bench_cross_validation.py [--replicate 50] [--jobs 1 2 4 8]
+"""
+
+import argparse
+import dataclasses
+import os
+import numpy as np
+from ml_project.config.configuration import ConfigurationManager
+from ml_project.components.cross_validation import CrossValidation
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--replicate", type=int, default=50)
+    parser.add_argument("--jobs", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    config = ConfigurationManager().get_cross_validation_config()
+    config = dataclasses.replace(config, n_splits=max(args.jobs))
+    cross_validation = CrossValidation(config=config)
+    cross_validation.prepare_data()
+
+    # replicate the rows with a little noise so each fold does a meaningful amount of work
+    rng = np.random.default_rng(0)
+    for name in ("x", "y", "folds"):
+        path = os.path.join(config.root_dir, f"{name}.npy")
+        array = np.load(path)
+        array = np.concatenate([array] * args.replicate)
+        if name == "x":
+            array = array * rng.normal(1.0, 0.01, array.shape)
+        np.save(path, array)
+
+    print(f"{'workers':>7} {'wall s':>8} {'speedup':>8}")
+    baseline = None
+    for n_jobs in args.jobs:
+        cross_validation.config = dataclasses.replace(config, n_jobs=n_jobs)
+        results = cross_validation.evaluate()
+        baseline = baseline or results["wall_seconds"]
+        print(f"{n_jobs:>7} {results['wall_seconds']:>8.3f} "
+              f"{baseline / results['wall_seconds']:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
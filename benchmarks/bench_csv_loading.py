@@ -0,0 +1,108 @@
+"""
+Measures load time and peak memory of the CSV reads of each pipeline stage.
+
+Compares the untyped `pd.read_csv` calls the stages used to make with the
+schema-driven `read_typed_csv` loader, and its float32/int8 downcast mode for training.
+Every measurement runs in a fresh process so that its peak RSS is its own (Linux only,
+peak RSS is read from /proc). The input is
+the ingested dataset resampled to `--rows` rows, used as both the train and test split.
+
+Usage:
+    python benchmarks/bench_csv_loading.py [--rows 1000000] [--repeat 3]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+from ml_project.config.configuration import ConfigurationManager
+from ml_project.utils.data_loading import PARSER_ENGINE, read_typed_csv
+
+
+def untyped(path, schema, target):
+    return {
+        "data_validation": lambda: pd.read_csv(path),
+        "data_transformation": lambda: pd.read_csv(path),
+        "model_trainer": lambda: (pd.read_csv(path), pd.read_csv(path)),
+        "model_evaluation": lambda: pd.read_csv(path),
+    }
+
+
+def typed(path, schema, target):
+    return {
+        "data_validation": lambda: (pd.read_csv(path, nrows=0), read_typed_csv(path, schema)),
+        "data_transformation": lambda: read_typed_csv(path, schema),
+        "model_trainer": lambda: read_typed_csv(path, schema),
+        "model_evaluation": lambda: read_typed_csv(path, schema),
+    }
+
+
+def downcast(path, schema, target):
+    return {"model_trainer": lambda: read_typed_csv(path, schema, downcast=True)}
+
+
+MODES = {"untyped": untyped, "typed": typed, "downcast": downcast}
+
+
+def rss_kb(field):
+    with open("/proc/self/status", encoding="utf-8") as f:
+        return next(int(line.split()[1]) for line in f if line.startswith(field))
+
+
+def measure(path, stage, mode, repeat):
+    """
+    Runs one stage's reads in this process and prints the best time in seconds and the
+    peak RSS growth of the first run in MB. The peak left by the imports is reset first.
+    """
+    schema = ConfigurationManager().schema
+    load = MODES[mode](path, schema.COLUMNS, schema.TARGET_COLUMN.name)[stage]
+    with open("/proc/self/clear_refs", "w", encoding="utf-8") as f:
+        f.write("5")
+    before = rss_kb("VmRSS:")
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        load()
+        times.append(time.perf_counter() - start)
+        if len(times) == 1:
+            peak = rss_kb("VmHWM:") - before
+    print(min(times), peak / 1024)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--measure", nargs=3, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.measure:
+        measure(*args.measure, args.repeat)
+        return
+
+    config = ConfigurationManager().get_data_validation_config()
+    data = pd.read_csv(config.unzip_data_dir)
+    rows = np.random.default_rng(0).integers(0, len(data), args.rows)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "data.csv")
+        data.iloc[rows].to_csv(path, index=False)
+        print(f"rows: {args.rows:,}  file: {os.path.getsize(path) / 2**20:.0f} MB  "
+              f"engine: {PARSER_ENGINE}")
+        print(f"{'stage':<20} {'mode':<9} {'seconds':>8} {'peak MB':>8}")
+        for stage in typed(path, None, None):
+            for mode in MODES:
+                if stage not in MODES[mode](path, None, None):
+                    continue
+                out = subprocess.run(
+                    [sys.executable, __file__, "--measure", path, stage, mode,
+                     "--repeat", str(args.repeat)],
+                    capture_output=True, text=True, check=True).stdout.split()
+                seconds, peak = float(out[-2]), float(out[-1])
+                print(f"{stage:<20} {mode:<9} {seconds:>8.2f} {peak:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Measures the per-request overhead the drift monitor adds to /predict.
+
+Replays single-row requests drawn from the test split and reports the mean latency of
+`DriftMonitor.observe` next to the model's own `predict`, then the observe throughput
+from several threads at once and the cost of one background refresh.
+
+Usage:
+    python benchmarks/bench_drift_monitor.py [--requests 20000] [--threads 4]
+"""
+
+import argparse
+import threading
+import time
+import warnings
+import joblib
+import numpy as np
+import pandas as pd
+from ml_project.config.configuration import ConfigurationManager
+from ml_project.components.drift_monitor import DriftMonitor
+
+
+def per_call(func, rows):
+    start = time.perf_counter()
+    for row in rows:
+        func(row)
+    return (time.perf_counter() - start) / len(rows)
+
+
+def main():
+    warnings.filterwarnings("ignore", message="X does not have valid feature names")
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--threads", type=int, default=4)
+    args = parser.parse_args()
+
+    config = ConfigurationManager()
+    trainer_config = config.get_model_trainer_config()
+    monitor = DriftMonitor(config=config.get_drift_monitor_config())
+    model = joblib.load(config.config.model_evaluation.model_path)
+
+    test = pd.read_csv(trainer_config.test_data_path)
+    features = test.drop([trainer_config.target_column], axis=1).to_numpy()
+    index = np.random.default_rng(0).integers(0, len(features), args.requests)
+    rows = [features[i].reshape(1, -1) for i in index]
+
+    predict_seconds = per_call(model.predict, rows[:2000])
+    observe_seconds = per_call(monitor.observe, rows)
+    print(f"model.predict   {predict_seconds * 1e6:8.2f} us/request")
+    print(f"monitor.observe {observe_seconds * 1e6:8.2f} us/request "
+          f"({observe_seconds / predict_seconds:.1%} of predict)")
+
+    chunks = np.array_split(np.arange(len(rows)), args.threads)
+    threads = [threading.Thread(target=lambda c=c: [monitor.observe(rows[i]) for i in c])
+               for c in chunks]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    print(f"{args.threads} threads: {len(rows) / elapsed:,.0f} observations/s")
+
+    start = time.perf_counter()
+    report = monitor.refresh()
+    print(f"refresh over {report['count']} rows: {(time.perf_counter() - start) * 1e3:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
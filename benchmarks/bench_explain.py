@@ -0,0 +1,59 @@
+"""
+Measures the throughput of vectorized contribution explanations.
+
+Explains a batch of rows (1M by default, resampled from the test split) with one
+broadcasted operation, with and without a top-k selection per row, and compares it
+with explaining the rows one at a time.
+
+Usage:
+    python benchmarks/bench_explain.py [--rows 1000000] [--top-k 3]
+"""
+
+import argparse
+import time
+import numpy as np
+import pandas as pd
+from ml_project.config.configuration import ConfigurationManager
+from ml_project.components.explainer import load_explainer
+from ml_project.pipeline.prediction import load_prediction_pipeline
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--top-k", type=int, default=3)
+    args = parser.parse_args()
+
+    config = ConfigurationManager().get_explainer_config()
+    columns = config.feature_columns
+    explainer = load_explainer(config, load_prediction_pipeline())
+    test = pd.read_csv("artifacts/data_transformation/test.csv")
+    matrix = test[columns].to_numpy()[np.random.default_rng(0).integers(0, len(test), args.rows)]
+    buffer = np.empty_like(matrix)
+
+    start = time.perf_counter()
+    contributions = explainer.contributions(matrix, out=buffer)
+    full = time.perf_counter() - start
+
+    start = time.perf_counter()
+    explainer.top_k(contributions, args.top_k)
+    top_k = time.perf_counter() - start
+
+    sample = matrix[:10_000]
+    start = time.perf_counter()
+    for row in sample:
+        explainer.contributions(row[None, :])
+    per_row = (time.perf_counter() - start) / len(sample)
+
+    print(f"rows: {args.rows:,}")
+    print(f"contributions     {full * 1e3:9.1f} ms  {args.rows / full:>14,.0f} rows/s")
+    print(f"top-{args.top_k} selection   {top_k * 1e3:9.1f} ms  {args.rows / top_k:>14,.0f} rows/s")
+    print(f"row by row        {per_row * args.rows * 1e3:9.1f} ms  {1 / per_row:>14,.0f} rows/s "
+          "(extrapolated)")
+    check = explainer.baseline + contributions[:1000].sum(axis=1)
+    expected = load_prediction_pipeline().predict_raw(matrix[:1000], columns)
+    print(f"max |baseline + sum(contributions) - prediction|: {np.abs(check - expected).max():.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Compares ElasticNet convergence on raw versus standardized features.
+
+Fits the model from params.yaml on the training split twice, once on raw features and
+once on features standardized with streaming statistics and folded back into the
+coefficients, and reports coordinate-descent iterations, fit time and the largest
+prediction difference of the folded model against scaling at predict time.
+
+Usage:
+    python benchmarks/bench_feature_scaling.py [--data artifacts/data_transformation/train.csv]
+"""
+
+import argparse
+import time
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import ElasticNet
+from ml_project.config.configuration import ConfigurationManager
+from ml_project.utils.feature_stats import RunningMoments, fold_standardization
+
+
+def fit(train_x, train_y, params, repeats):
+    best = float("inf")
+    for _ in range(repeats):
+        model = ElasticNet(alpha=params.alpha, l1_ratio=params.l1_ratio, random_state=42)
+        start = time.perf_counter()
+        model.fit(train_x, train_y)
+        best = min(best, time.perf_counter() - start)
+    return model, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--data", default="artifacts/data_transformation/train.csv")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    config = ConfigurationManager()
+    params = config.params.ElasticNet
+    target = config.schema.TARGET_COLUMN.name
+
+    data = pd.read_csv(args.data)
+    train_x = data.drop([target], axis=1).to_numpy()
+    train_y = data[target].to_numpy()
+
+    raw_model, raw_seconds = fit(train_x, train_y, params, args.repeats)
+
+    stats = RunningMoments(range(train_x.shape[1])).update(train_x)
+    scaled_x = (train_x - stats.mean) / stats.scale
+    scaled_model, scaled_seconds = fit(scaled_x, train_y, params, args.repeats)
+    reference = scaled_model.predict(scaled_x)
+    fold_standardization(scaled_model, stats.mean, stats.scale)
+    fold_error = np.abs(scaled_model.predict(train_x) - reference).max()
+
+    print(f"rows: {train_x.shape[0]}, features: {train_x.shape[1]}")
+    print(f"raw          n_iter={raw_model.n_iter_:>6}  fit={raw_seconds * 1e3:9.3f} ms")
+    print(f"standardized n_iter={scaled_model.n_iter_:>6}  fit={scaled_seconds * 1e3:9.3f} ms")
+    print(f"max |folded - scaled| prediction difference: {fold_error:.3e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Compares incremental, warm-started retraining with a from-scratch refit.
+
+Builds a history by replicating the training split with a little noise, then for each
+batch of appended rows measures a from-scratch ElasticNet refit on history + batch
+against adding the batch to the Gram statistics and solving warm-started from the
+previous coefficients, and reports both test RMSEs.
+
+Usage:
+    python benchmarks/bench_incremental_training.py [--history 200000] [--batch 5000]
+"""
+
+import argparse
+import time
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import ElasticNet
+from sklearn.metrics import mean_squared_error
+from ml_project.config.configuration import ConfigurationManager
+from ml_project.utils.gram_stats import GramStatistics
+
+
+def noisy_rows(x, y, n_rows, rng):
+    index = rng.integers(0, len(y), n_rows)
+    return x[index] * rng.normal(1.0, 0.01, (n_rows, x.shape[1])), y[index]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--history", type=int, default=200_000)
+    parser.add_argument("--batch", type=int, default=5_000)
+    parser.add_argument("--batches", type=int, default=3)
+    args = parser.parse_args()
+
+    config = ConfigurationManager().get_model_trainer_config()
+    train = pd.read_csv(config.train_data_path)
+    test = pd.read_csv(config.test_data_path)
+    target = config.target_column
+    x, y = train.drop([target], axis=1).to_numpy(), train[target].to_numpy(dtype=float)
+    test_x, test_y = test.drop([target], axis=1).to_numpy(), test[target].to_numpy()
+
+    rng = np.random.default_rng(0)
+    history_x, history_y = noisy_rows(x, y, args.history, rng)
+    stats = GramStatistics(x.shape[1]).update(history_x, history_y)
+    coef, _, _ = stats.solve_elastic_net(config.alpha, config.l1_ratio)
+
+    print(f"{'rows':>9} {'scratch ms':>11} {'iters':>6} {'rmse':>8} "
+          f"{'warm ms':>9} {'iters':>6} {'rmse':>8}")
+    for _ in range(args.batches):
+        batch_x, batch_y = noisy_rows(x, y, args.batch, rng)
+        history_x = np.concatenate([history_x, batch_x])
+        history_y = np.concatenate([history_y, batch_y])
+
+        start = time.perf_counter()
+        model = ElasticNet(alpha=config.alpha, l1_ratio=config.l1_ratio, random_state=42)
+        model.fit(history_x, history_y)
+        scratch_ms = (time.perf_counter() - start) * 1e3
+        scratch_rmse = np.sqrt(mean_squared_error(test_y, model.predict(test_x)))
+
+        start = time.perf_counter()
+        stats.update(batch_x, batch_y)
+        coef, intercept, n_iter = stats.solve_elastic_net(config.alpha, config.l1_ratio,
+                                                          coef_init=coef)
+        warm_ms = (time.perf_counter() - start) * 1e3
+        warm_rmse = np.sqrt(mean_squared_error(test_y, test_x @ coef + intercept))
+
+        print(f"{len(history_y):>9} {scratch_ms:>11.2f} {model.n_iter_:>6} {scratch_rmse:>8.4f} "
+              f"{warm_ms:>9.2f} {n_iter:>6} {warm_rmse:>8.4f}")
+
+
+if __name__ == "__main__":
+    main()
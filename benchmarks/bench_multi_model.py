@@ -0,0 +1,59 @@
+"""
+Measures the latency added by scoring several model versions at once.
+
+Compares single-model `PredictionPipeline.predict_raw` with
+`MultiModelPredictionPipeline.predict` serving 1, 2, 4 and 8 versions (the published
+model repeated, with A/B weights), for single-row requests and batches.
+
+Usage:
+    python benchmarks/bench_multi_model.py [--seconds 1.0]
+"""
+
+import argparse
+import dataclasses
+import time
+import numpy as np
+import pandas as pd
+from box import ConfigBox
+from ml_project.config.configuration import ConfigurationManager
+from ml_project.pipeline.prediction import MODEL_PATH, load_prediction_pipeline
+from ml_project.pipeline.multi_model_prediction import MultiModelPredictionPipeline
+
+
+def us_per_call(func, seconds):
+    calls, start = 0, time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        func()
+        calls += 1
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--seconds", type=float, default=1.0)
+    args = parser.parse_args()
+
+    config = ConfigurationManager().get_serving_config()
+    columns = config.feature_columns
+    pipeline = load_prediction_pipeline()
+    test = pd.read_csv("artifacts/data_transformation/test.csv")
+    rng = np.random.default_rng(0)
+
+    header = " ".join(f"{f'{m} models us':>13}" for m in (1, 2, 4, 8))
+    print(f"{'rows':>6} {'single us':>10} {header}")
+    for n_rows in (1, 1000):
+        matrix = test[columns].to_numpy()[rng.integers(0, len(test), n_rows)]
+        single = us_per_call(lambda: pipeline.predict_raw(matrix, columns), args.seconds)
+        multi = []
+        for n_models in (1, 2, 4, 8):
+            # two A/B arms, the rest shadows
+            models = [ConfigBox({"name": f"m{i}", "path": str(MODEL_PATH),
+                                 "weight": 1.0 if i < 2 else 0.0}) for i in range(n_models)]
+            multi_config = dataclasses.replace(config, models=models)
+            stacked = MultiModelPredictionPipeline(multi_config, [pipeline] * n_models)
+            multi.append(us_per_call(lambda: stacked.predict(matrix), args.seconds))
+        print(f"{n_rows:>6} {single:>10.2f} " + " ".join(f"{us:>13.2f}" for us in multi))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Compares the throughput of the packed binary prediction path with a JSON path.
+
+For several batch sizes, decodes and scores rows from a JSON body (json.loads, array
+construction, model.predict) and from a packed float64/float32 body (np.frombuffer,
+PredictionPipeline.predict_raw), then measures /predict/raw end to end through the
+Flask test client next to the form-based /predict.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_raw_predict.py [--seconds 1.0]
+"""
+
+import argparse
+import json
+import time
+import warnings
+import numpy as np
+import pandas as pd
+from ml_project.pipeline.prediction import load_prediction_pipeline
+
+
+def rows_per_second(func, n_rows, seconds):
+    calls, start = 0, time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        func()
+        calls += 1
+    return calls * n_rows / (time.perf_counter() - start)
+
+
+def main():
+    warnings.filterwarnings("ignore", message="X does not have valid feature names")
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--seconds", type=float, default=1.0)
+    args = parser.parse_args()
+
+    import app  # pylint: disable=import-outside-toplevel
+    columns = app.FEATURE_COLUMNS
+    pipeline = load_prediction_pipeline()
+    test = pd.read_csv("artifacts/data_transformation/test.csv")
+    rng = np.random.default_rng(0)
+
+    print(f"{'rows':>7} {'json rows/s':>14} {'raw f64 rows/s':>15} {'raw f32 rows/s':>15}")
+    for n_rows in (1, 100, 10_000):
+        matrix = test[columns].to_numpy()[rng.integers(0, len(test), n_rows)]
+        payload = json.dumps(matrix.tolist())
+        body64 = matrix.astype("<f8").tobytes()
+        body32 = matrix.astype("<f4").tobytes()
+
+        def from_json():
+            pipeline.predict(np.array(json.loads(payload), dtype=np.float64))
+
+        def from_raw(body, dtype):
+            data = np.frombuffer(body, dtype=dtype).reshape(-1, len(columns))
+            pipeline.predict_raw(data, columns).tobytes()
+
+        print(f"{n_rows:>7} {rows_per_second(from_json, n_rows, args.seconds):>14,.0f} "
+              f"{rows_per_second(lambda: from_raw(body64, '<f8'), n_rows, args.seconds):>15,.0f} "
+              f"{rows_per_second(lambda: from_raw(body32, '<f4'), n_rows, args.seconds):>15,.0f}")
+
+    client = app.app.test_client()
+    row = test[columns].to_numpy()[:1]
+    form = {col.replace(" ", "_"): str(value) for col, value in zip(columns, row[0])}
+    body = row.astype("<f8").tobytes()
+    form_rate = rows_per_second(lambda: client.post("/predict", data=form), 1, args.seconds)
+    raw_rate = rows_per_second(
+        lambda: client.post("/predict/raw", data=body,
+                            content_type="application/octet-stream"), 1, args.seconds)
+    print(f"end to end, 1 row/request: /predict {form_rate:,.0f} req/s, "
+          f"/predict/raw {raw_rate:,.0f} req/s")
+    app.prediction_log.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Measures the throughput of sharded validation and splitting against worker count.
+
+Writes the ingested dataset, resampled to `--rows` rows, as `--shards` shard files, then
+times `DataValidation` (schema check and duplicate counts) and
+`DataTransformation.split_shards` with 1, 2, 4, ... worker processes up to the number of
+cores, and the single-file path on the same rows as a baseline.
+
+Usage:
+    python benchmarks/bench_sharded_pipeline.py [--rows 2000000] [--shards 8]
+"""
+
+import argparse
+import dataclasses
+import os
+import tempfile
+import time
+from pathlib import Path
+import numpy as np
+import pandas as pd
+from ml_project.config.configuration import ConfigurationManager
+from ml_project.components.data_validation import DataValidation
+from ml_project.components.data_transformation import DataTransformation
+from ml_project.utils.common import save_json
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--shards", type=int, default=8)
+    args = parser.parse_args()
+
+    manager = ConfigurationManager()
+    validation_config = manager.get_data_validation_config()
+    transformation_config = manager.get_data_transformation_config()
+    data = pd.read_csv(validation_config.unzip_data_dir)
+    rows = np.random.default_rng(0).integers(0, len(data), args.rows)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        single = os.path.join(tmp, "data.csv")
+        data.iloc[rows].to_csv(single, index=False)
+        shards = []
+        for i, part in enumerate(np.array_split(rows, args.shards)):
+            shards.append(os.path.join(tmp, f"shard-{i:03d}.csv"))
+            data.iloc[part].to_csv(shards[-1], index=False)
+        shards_file = os.path.join(tmp, "shards.json")
+        save_json(path=Path(shards_file), data={"shards": shards})
+
+        def run(n_jobs, sharded):
+            paths = {
+                "shards_file": shards_file if sharded else os.path.join(tmp, "none.json"),
+                "n_jobs": n_jobs,
+            }
+            validation = dataclasses.replace(
+                validation_config, unzip_data_dir=single,
+                delta_path=os.path.join(tmp, "none.csv"),
+                duplicates_file=os.path.join(tmp, "duplicates.json"), **paths)
+            transformation = dataclasses.replace(
+                transformation_config, root_dir=tmp, data_path=single,
+                row_hashes_file=os.path.join(tmp, "row_hashes.npy"),
+                train_delta_file=os.path.join(tmp, "train_delta.csv"),
+                partitions_dir=os.path.join(tmp, "partitions"), **paths)
+            start = time.perf_counter()
+            DataValidation(validation).validate_all_columns()
+            DataValidation(validation).count_duplicates()
+            validate = time.perf_counter() - start
+            start = time.perf_counter()
+            if sharded:
+                DataTransformation(transformation).split_shards()
+            else:
+                DataTransformation(transformation).train_test_spliting()
+            return validate, time.perf_counter() - start
+
+        print(f"rows: {args.rows:,}  shards: {args.shards}  cores: {os.cpu_count()}")
+        print(f"{'run':<16} {'validate s':>10} {'split s':>8} {'rows/s':>12}")
+        timings = [("single file", run(1, False))]
+        n_jobs = 1
+        while n_jobs <= min(os.cpu_count(), args.shards):
+            timings.append((f"{n_jobs} workers", run(n_jobs, True)))
+            n_jobs *= 2
+        for name, (validate, split) in timings:
+            print(f"{name:<16} {validate:>10.2f} {split:>8.2f} "
+                  f"{args.rows / (validate + split):>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,30 +1,48 @@
+import argparse
 from ml_project import logger
+from ml_project.config.configuration import ConfigurationManager
+from ml_project.utils.profiling import Profiler, profiling_enabled
 from ml_project.pipeline.stage_01_data_ingestion import DataIngestionTrainingPipeline
 from ml_project.pipeline.stage_02_data_validation import DataValidationTrainingPipeline
 from ml_project.pipeline.stage_03_data_transformation import DataTransformationTrainingPipeline
 from ml_project.pipeline.stage_04_model_trainer import ModelTrainerPipeline
 from ml_project.pipeline.stage_05_model_evaluation import ModelEvaluationTrainingPipeline
+from ml_project.pipeline.stage_06_cross_validation import CrossValidationTrainingPipeline
 
-def run_pipeline_stage(stage_name, pipeline_class):
+def run_pipeline_stage(stage_name, pipeline_class, profile=False):
     """
     Run a pipeline stage and handle logging and exceptions.
 
     Args:
         stage_name (str): The name of the stage.
         pipeline_class: The pipeline class to instantiate and run.
+        profile (bool, optional): If True, the stage is profiled and the reports are
+            saved under the profiling root_dir. Defaults to False.
     """
     try:
         logger.info(">>>>> %s Started <<<<<", stage_name)
         pipeline_obj = pipeline_class()
-        pipeline_obj.main()
+        if profile:
+            with Profiler(stage_name, ConfigurationManager().get_profiling_config()):
+                pipeline_obj.main()
+        else:
+            pipeline_obj.main()
         logger.info(">>>>> %s Completed <<<<<\nx==========x", stage_name)
     except Exception as e:
         logger.exception(e)
         raise e
 
-# Run each pipeline stage
-run_pipeline_stage('Data Ingestion Stage', DataIngestionTrainingPipeline)
-run_pipeline_stage('Data Validation Stage', DataValidationTrainingPipeline)
-run_pipeline_stage('Data Transformation Stage', DataTransformationTrainingPipeline)
-run_pipeline_stage('Model Training Stage', ModelTrainerPipeline)
-run_pipeline_stage('Evaluation of Model', ModelEvaluationTrainingPipeline)
\ No newline at end of file
+# Run each pipeline stage. Guarded so that worker processes started with the 'spawn'
+# method (e.g. the cross-validation pool) can import this module without rerunning it.
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Run the training pipeline")
+    parser.add_argument("--profile", action="store_true",
+                        help="profile every stage (also enabled by ML_PROJECT_PROFILE=1)")
+    profile = parser.parse_args().profile or profiling_enabled()
+
+    run_pipeline_stage('Data Ingestion Stage', DataIngestionTrainingPipeline, profile)
+    run_pipeline_stage('Data Validation Stage', DataValidationTrainingPipeline, profile)
+    run_pipeline_stage('Data Transformation Stage', DataTransformationTrainingPipeline, profile)
+    run_pipeline_stage('Model Training Stage', ModelTrainerPipeline, profile)
+    run_pipeline_stage('Evaluation of Model', ModelEvaluationTrainingPipeline, profile)
+    run_pipeline_stage('Cross Validation Stage', CrossValidationTrainingPipeline, profile)
\ No newline at end of file
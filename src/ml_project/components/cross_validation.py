@@ -0,0 +1,132 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import ElasticNet
+from sklearn.metrics import mean_squared_error, mean_absolute_error, r2_score
+from ml_project import logger
+from ml_project.entity.config_entity import CrossValidationConfig
+from ml_project.utils.common import save_json, load_json, atomic_write
+from ml_project.utils.data_loading import read_typed_csv
+from ml_project.utils.feature_stats import RunningMoments, fold_standardization
+from ml_project.utils.row_hashing import row_hashes
+
+
+def _evaluate_fold(root_dir, fold, alpha, l1_ratio, standardize):
+    """
+    Fits and scores one fold. Runs in a worker process, which memory-maps the arrays
+    written by `CrossValidation.prepare_data` instead of receiving the data pickled.
+    """
+    x = np.load(os.path.join(root_dir, "x.npy"), mmap_mode="r")
+    y = np.load(os.path.join(root_dir, "y.npy"), mmap_mode="r")
+    folds = np.load(os.path.join(root_dir, "folds.npy"), mmap_mode="r")
+    test = folds == fold
+    train_x, train_y = x[~test], y[~test]
+    test_x, test_y = x[test], y[test]
+
+    stats = None
+    if standardize:
+        stats = RunningMoments(range(x.shape[1])).update(train_x)
+        train_x = (train_x - stats.mean) / stats.scale
+
+    model = ElasticNet(alpha=alpha, l1_ratio=l1_ratio, random_state=42)
+    start = time.perf_counter()
+    model.fit(train_x, train_y)
+    fit_seconds = time.perf_counter() - start
+    if stats is not None:
+        fold_standardization(model, stats.mean, stats.scale)
+
+    pred = model.predict(test_x)
+    return {
+        "fold": int(fold),
+        "n_train": int(len(train_y)),
+        "n_test": int(len(test_y)),
+        "rmse": float(np.sqrt(mean_squared_error(test_y, pred))),
+        "mae": float(mean_absolute_error(test_y, pred)),
+        "r2": float(r2_score(test_y, pred)),
+        "fit_seconds": fit_seconds,
+    }
+
+
+class CrossValidation:
+    """
+    A class for k-fold cross-validation of the ElasticNet model, with folds evaluated in
+    parallel in a process pool.
+
+    Attributes:
+        config (CrossValidationConfig): Configuration object containing settings for cross-validation.
+    """
+
+    def __init__(self, config: CrossValidationConfig):
+        """
+        Initializes the CrossValidation object with the given configuration.
+
+        Parameters:
+            config (CrossValidationConfig): The configuration for cross-validation.
+        """
+        self.config = config
+
+    def prepare_data(self):
+        """
+        Writes the features, target and fold assignment as `.npy` files under `root_dir`,
+        so every worker memory-maps the same read-only pages. The rows are those of the
+        train and test splits, which the data transformation stage merges from every
+        shard in a sharded run. A row's fold comes from the hash of its features, like
+        its split side, so rows with identical features never end up on both sides of
+        a fold.
+        """
+        data = pd.concat([read_typed_csv(path, self.config.all_schema)
+                          for path in (self.config.train_data_path, self.config.test_data_path)],
+                         ignore_index=True)
+        features = [col for col in self.config.all_schema if col != self.config.target_column]
+        x = data[features].to_numpy(dtype=np.float64)
+        y = data[self.config.target_column].to_numpy(dtype=np.float64)
+        folds = (row_hashes(data, features) % np.uint64(self.config.n_splits)).astype(np.int64)
+
+        for name, array in (("x.npy", x), ("y.npy", y), ("folds.npy", folds)):
+            with atomic_write(os.path.join(self.config.root_dir, name), "wb") as f:
+                np.save(f, array)
+        logger.info("Prepared %s rows for %s-fold cross-validation", len(y), self.config.n_splits)
+
+    def evaluate(self) -> dict:
+        """
+        Evaluates every fold in a process pool and adds the per-fold and aggregate
+        RMSE/MAE/R2 under `cross_validation` in the metrics file.
+
+        Returns:
+            dict: The cross-validation results.
+        """
+        n_jobs = self.config.n_jobs or os.cpu_count()
+        n_jobs = min(n_jobs, self.config.n_splits)
+
+        start = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            futures = [
+                executor.submit(_evaluate_fold, self.config.root_dir, fold,
+                                self.config.alpha, self.config.l1_ratio, self.config.standardize)
+                for fold in range(self.config.n_splits)
+            ]
+            folds = [future.result() for future in futures]
+        wall_seconds = time.perf_counter() - start
+
+        results = {
+            "n_splits": self.config.n_splits,
+            "n_jobs": n_jobs,
+            "wall_seconds": wall_seconds,
+            "folds": folds,
+        }
+        for metric in ("rmse", "mae", "r2"):
+            values = np.array([fold[metric] for fold in folds])
+            results[metric] = {"mean": float(values.mean()), "std": float(values.std())}
+
+        metric_file = Path(self.config.metric_file_name)
+        metrics = dict(load_json(metric_file)) if metric_file.exists() else {}
+        metrics["cross_validation"] = results
+        save_json(path=metric_file, data=metrics)
+
+        logger.info("Cross-validated %s folds on %s workers in %.3fs: rmse %.4f +/- %.4f",
+                    self.config.n_splits, n_jobs, wall_seconds,
+                    results["rmse"]["mean"], results["rmse"]["std"])
+        return results
@@ -1,28 +1,222 @@
 import os
+import glob
+import hashlib
+import shutil
+import tempfile
 import urllib.request as request
+from urllib.error import HTTPError
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from ml_project import logger
-from ml_project.utils.common import get_size
+from ml_project.utils.common import get_size, save_json, load_json, atomic_write
 from pathlib import Path
 from ml_project.entity.config_entity import DataIngestionConfig
 
+def _download(url: str, path, validators: dict = None):
+    """
+    Downloads `url` to `path` through a temporary file, so an interrupted download never
+    leaves a truncated file behind. With `validators` (the `ETag` and `Last-Modified`
+    of an earlier download), the request is conditional. Returns the response headers,
+    or None when the server reports the content unchanged.
+    """
+    headers = {}
+    if validators and validators.get("ETag"):
+        headers["If-None-Match"] = validators["ETag"]
+    if validators and validators.get("Last-Modified"):
+        headers["If-Modified-Since"] = validators["Last-Modified"]
+    try:
+        with request.urlopen(request.Request(url, headers=headers)) as response, \
+                atomic_write(path, "wb") as f:
+            shutil.copyfileobj(response, f, 1 << 20)
+            return response.headers
+    except HTTPError as e:
+        if e.code == 304:
+            return None
+        raise
+
+
+def _extract(zip_ref: zipfile.ZipFile, unzip_path, members=None) -> list:
+    """
+    Extracts the files of an archive into a temporary directory under `unzip_path`, then
+    renames each one into place, so readers never see a partially extracted file.
+    Returns the names of the extracted files.
+    """
+    names = [name for name in (zip_ref.namelist() if members is None else members) if not name.endswith("/")]
+    os.makedirs(unzip_path, exist_ok=True)
+    tmp_dir = tempfile.mkdtemp(dir=unzip_path, prefix=".extract.")
+    try:
+        zip_ref.extractall(tmp_dir, members=names)
+        for name in names:
+            target = os.path.join(unzip_path, name)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            os.replace(os.path.join(tmp_dir, name), target)
+    finally:
+        shutil.rmtree(tmp_dir)
+    return names
+
+
+def _fetch_source(index: int, source: str, shard_dir: str) -> list:
+    """
+    Downloads a source when it is a URL and extracts it when it is a zip archive.
+    Downloads and extracted archives are named after the source's position and a hash
+    of the full source, so sources sharing a file name never overwrite each other. URLs
+    are downloaded again on every run, as their content may have changed.
+
+    Args:
+        index (int): The position of the source in the expanded source list.
+        source (str): A URL or a local path of a csv or zip file.
+        shard_dir (str): The directory downloads and extracted archives are written to.
+
+    Returns:
+        list: The paths of the csv files of the source.
+    """
+    digest = hashlib.sha1(source.encode("utf-8")).hexdigest()[:12]
+    name = f"{index:04d}-{digest}-{os.path.basename(source.split('?')[0])}"
+    path = source
+    if source.startswith(("http://", "https://")):
+        path = os.path.join(shard_dir, name)
+        _download(source, path)
+        logger.info("%s downloaded to %s", source, path)
+    if not zipfile.is_zipfile(path):
+        return [path]
+    unzip_path = os.path.join(shard_dir, Path(name).stem)
+    with zipfile.ZipFile(path, 'r') as zip_ref:
+        names = _extract(zip_ref, unzip_path,
+                         [name for name in zip_ref.namelist() if name.endswith(".csv")])
+    return [os.path.join(unzip_path, name) for name in sorted(names)]
+
+
 class DataIngestion:
     def __init__(self,config: DataIngestionConfig):
         self.config = config
         
     def download_file(self):
-        if not os.path.exists(self.config.local_data_file):
-            filename, headers = request.urlretrieve(
-                url=self.config.source_URL,
-                filename=self.config.local_data_file
-            )
-            logger.info(f"{filename} downloaded with info:\n{headers}")
-        else:
+        # incremental runs check the source for appended rows with a conditional request
+        if os.path.exists(self.config.local_data_file) and not self.config.incremental:
             logger.info(f"File exists of size: {get_size(Path(self.config.local_data_file))}")
+            return
+        validators = None
+        if os.path.exists(self.config.local_data_file) and os.path.exists(self.config.download_state_file):
+            validators = load_json(Path(self.config.download_state_file)).to_dict()
+        headers = _download(self.config.source_URL, self.config.local_data_file, validators)
+        if headers is None:
+            logger.info(f"{self.config.source_URL} unchanged since the last download")
+            return
+        logger.info(f"{self.config.local_data_file} downloaded with info:\n{headers}")
+        save_json(path=Path(self.config.download_state_file),
+                  data={key: headers[key] for key in ("ETag", "Last-Modified") if key in headers})
             
             
     def extract_zip_file(self):
         unzip_path = self.config.unzip_dir
         os.makedirs(unzip_path, exist_ok=True)
         with zipfile.ZipFile(self.config.local_data_file,  'r') as zip_ref:
-            zip_ref.extractall(unzip_path)
\ No newline at end of file
+            _extract(zip_ref, unzip_path)
+
+
+    def ingest_shards(self) -> list:
+        """
+        Ingests every configured source as a shard of the dataset. Local globs are
+        expanded, and URLs are downloaded and archives extracted concurrently in a pool of
+        `max_workers` threads. The csv paths of the shards are saved to `shards_file` for
+        the later stages. Sharded runs are always full runs.
+
+        Returns:
+            list: The paths of the shard csv files, in source order.
+        """
+        os.makedirs(self.config.shard_dir, exist_ok=True)
+        sources = []
+        for source in self.config.sources:
+            if source.startswith(("http://", "https://")):
+                sources.append(source)
+            else:
+                matches = sorted(glob.glob(source))
+                if not matches:
+                    logger.warning("No files match source %s", source)
+                sources.extend(matches)
+        if not sources:
+            raise FileNotFoundError(f"No shards found for sources {self.config.sources}")
+
+        with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
+            fetched = executor.map(_fetch_source, range(len(sources)), sources,
+                                   [self.config.shard_dir] * len(sources))
+            shards = [path for paths in fetched for path in paths]
+
+        for path in (self.config.delta_file, self.config.pending_state_file):
+            if os.path.exists(path):
+                os.remove(path)
+        save_json(path=Path(self.config.shards_file), data={"shards": shards})
+        logger.info("Ingested %s shards from %s sources", len(shards), len(sources))
+        return shards
+
+
+    def _hash_file(self, checkpoint: int):
+        """
+        Hashes the data file in one pass, also returning the hash of its first
+        `checkpoint` bytes and whether that prefix ends on a line boundary.
+        """
+        digest = hashlib.sha256()
+        last = b""
+        with open(self.config.data_file, 'rb') as f:
+            remaining = checkpoint
+            while remaining > 0:
+                block = f.read(min(remaining, 1 << 20))
+                if not block:
+                    break
+                digest.update(block)
+                remaining -= len(block)
+                last = block[-1:]
+            prefix_hash = digest.hexdigest()
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        return digest.hexdigest(), prefix_hash, checkpoint == 0 or last == b"\n"
+
+
+    def detect_new_rows(self) -> int:
+        """
+        Compares the extracted data file with the watermark of the previous run, the byte
+        offset and content hash of the data seen so far. When the file is unchanged or
+        only grew, the appended rows (possibly none) are written to `delta_file` for an
+        incremental run. Otherwise, or when incremental mode is off, any stale delta is
+        removed so the run is a full one.
+
+        The new watermark is saved to `pending_state_file` and only becomes the
+        watermark of the next run once the data transformation stage has consumed the
+        data (see `DataTransformation.commit_ingestion_state`), so rows of a run that
+        fails validation or transformation are detected again by the next one.
+
+        Returns:
+            int: The number of new rows written to `delta_file`, 0 for a full run.
+        """
+        # a single-source run supersedes the shard list of an earlier sharded run
+        if os.path.exists(self.config.shards_file):
+            os.remove(self.config.shards_file)
+
+        previous = None
+        if self.config.incremental and os.path.exists(self.config.state_file):
+            previous = load_json(Path(self.config.state_file))
+        for path in (self.config.delta_file, self.config.pending_state_file):
+            if os.path.exists(path):
+                os.remove(path)
+
+        size = os.path.getsize(self.config.data_file)
+        checkpoint = previous.size if previous is not None and previous.size <= size else 0
+        file_hash, prefix_hash, prefix_ends_line = self._hash_file(checkpoint)
+
+        n_new = 0
+        if checkpoint and prefix_hash == previous.sha256 and prefix_ends_line:
+            with open(self.config.data_file, 'rb') as f:
+                header = f.readline()
+                f.seek(checkpoint)
+                tail = f.read()
+            n_new = tail.count(b"\n") + (1 if tail and not tail.endswith(b"\n") else 0)
+            # written even when empty, so later stages know not to rebuild the splits
+            with atomic_write(self.config.delta_file, 'wb') as f:
+                f.write(header + tail)
+            logger.info("Incremental ingestion: %s new rows since the last run", n_new)
+        elif previous is not None:
+            logger.info("Data file no longer extends the last ingested data, running in full")
+
+        save_json(path=Path(self.config.pending_state_file),
+                  data={"size": size, "sha256": file_hash})
+        return n_new
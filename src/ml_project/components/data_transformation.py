@@ -1,14 +1,59 @@
 from ml_project import logger
-from sklearn.model_selection import train_test_split
-import pandas as pd
+import numpy as np
 from ml_project.entity.config_entity import DataTransformationConfig
+from ml_project.utils.common import save_json, load_json, atomic_write
+from ml_project.utils.data_loading import read_typed_csv
+from ml_project.utils.feature_stats import RunningMoments, BottomKSample, bin_counts
+from ml_project.utils.row_hashing import HashSet, in_test_split, row_hashes
+from ml_project.utils.sharding import load_shards, map_shards
+from pathlib import Path
+import itertools
+import json
 import os
+import shutil
+from contextlib import ExitStack
+
+
+def _split_shard(index: int, data_path, partitions_dir, all_schema: dict, features: list,
+                 test_size: float, drop: bool, chunk_size: int) -> dict:
+    """
+    Splits one shard into `train/part-<index>.csv` and `test/part-<index>.csv` under
+    `partitions_dir`, by the same feature hash as the single-file split. With `drop`,
+    duplicates within the shard are dropped and the hashes of the kept rows returned so
+    the parent can drop duplicates across shards. Runs in a worker process.
+    """
+    name = f"part-{index:05d}.csv"
+    paths = {side: os.path.join(partitions_dir, side, name) for side in ("train", "test")}
+    seen = HashSet()
+    result = {"rows": 0, "train": [], "test": [], "n_train": 0, "n_test": 0}
+    mode = "w"
+    for chunk in read_typed_csv(data_path, all_schema, chunksize=chunk_size):
+        result["rows"] += len(chunk)
+        hashes = row_hashes(chunk, features)
+        if drop:
+            first = seen.add(hashes)
+            chunk, hashes = chunk[first], hashes[first]
+        in_test = in_test_split(hashes, test_size)
+        for side, mask in (("train", ~in_test), ("test", in_test)):
+            chunk[mask].to_csv(paths[side], mode=mode, header=mode == "w", index=False)
+            result[f"n_{side}"] += int(mask.sum())
+            if drop:
+                result[side].append(hashes[mask])
+        mode = "a"
+    if drop:
+        for side in ("train", "test"):
+            result[side] = np.concatenate(result[side] or [np.empty(0, dtype=np.uint64)])
+    return result
 
 
 class DataTransformation:
     def __init__(self, config: DataTransformationConfig):
         self.config = config
 
+
+    def _feature_columns(self):
+        return [col for col in self.config.all_schema if col != self.config.target_column]
+
     
     ## Note: You can add different data transformation techniques such as Scaler, PCA and all
     # You can perform all kinds of EDA in ML cycle here before passing this data to the model
@@ -17,15 +62,208 @@ class DataTransformation:
 
 
     def train_test_spliting(self):
-        data = pd.read_csv(self.config.data_path)
+        """
+        Splits the dataset into `train.csv` and `test.csv` in one streaming pass. Each row
+        is assigned by a hash of its features, so rows with identical features always
+        land on the same side and cannot leak from the training set into the test set.
+        With `duplicates: drop`, only the first occurrence of each feature row is kept
+        and the hashes seen are saved for later incremental runs.
+        """
+        train_path = os.path.join(self.config.root_dir, "train.csv")
+        test_path = os.path.join(self.config.root_dir, "test.csv")
+        drop = self.config.duplicates == "drop"
+        seen = HashSet()
+        rows, n_train, n_test, header = 0, 0, 0, True
 
-        # Split the data into training and test sets. (0.75, 0.25) split.
-        train, test = train_test_split(data)
+        reader = read_typed_csv(self.config.data_path, self.config.all_schema,
+                                chunksize=self.config.chunk_size)
+        # both files replace those of an earlier run only once the whole split succeeded
+        with atomic_write(train_path, "w", encoding="utf-8", newline="") as train_file, \
+                atomic_write(test_path, "w", encoding="utf-8", newline="") as test_file:
+            for chunk in reader:
+                rows += len(chunk)
+                hashes = row_hashes(chunk, self._feature_columns())
+                if drop:
+                    first = seen.add(hashes)
+                    chunk, hashes = chunk[first], hashes[first]
+                in_test = in_test_split(hashes, self.config.test_size)
+                train, test = chunk[~in_test], chunk[in_test]
 
-        train.to_csv(os.path.join(self.config.root_dir, "train.csv"),index = False)
-        test.to_csv(os.path.join(self.config.root_dir, "test.csv"),index = False)
+                train.to_csv(train_file, header=header, index=False)
+                test.to_csv(test_file, header=header, index=False)
+                n_train, n_test, header = n_train + len(train), n_test + len(test), False
+
+        if drop:
+            seen.save(Path(self.config.row_hashes_file))
+        elif os.path.exists(self.config.row_hashes_file):
+            os.remove(self.config.row_hashes_file)
 
         logger.info("Splited data into training and test sets")
-        logger.info("Training data dimensions %s", train.shape)
-        logger.info("Test data dimensions %s", test.shape)
+        logger.info("Dropped %s duplicate rows out of %s", rows - n_train - n_test, rows)
+        logger.info("Training data rows %s", n_train)
+        logger.info("Test data rows %s", n_test)
+
+        # a full split supersedes any pending incremental training rows
+        if os.path.exists(self.config.train_delta_file):
+            os.remove(self.config.train_delta_file)
+
+
+    def split_shards(self):
+        """
+        Splits every shard of a sharded run in a pool of worker processes, each writing
+        its own train and test partition under `partitions_dir`, then merges the
+        partitions in shard order into `train.csv` and `test.csv`. Rows are assigned by
+        the same feature hash as `train_test_spliting`, so the result does not depend on
+        how the data is sharded. With `duplicates: drop`, rows already kept from an
+        earlier shard are dropped while merging.
+        """
+        shards = load_shards(self.config.shards_file)
+        drop = self.config.duplicates == "drop"
+        if os.path.exists(self.config.partitions_dir):
+            shutil.rmtree(self.config.partitions_dir)
+        for side in ("train", "test"):
+            os.makedirs(os.path.join(self.config.partitions_dir, side))
+
+        results = map_shards(_split_shard, shards, self.config.n_jobs,
+                             self.config.partitions_dir, dict(self.config.all_schema),
+                             self._feature_columns(), self.config.test_size, drop,
+                             self.config.chunk_size)
+
+        seen = HashSet()
+        kept = {"train": 0, "test": 0}
+        for side in ("train", "test"):
+            with atomic_write(os.path.join(self.config.root_dir, f"{side}.csv"), "wb") as out:
+                for i, result in enumerate(results):
+                    part = os.path.join(self.config.partitions_dir, side, f"part-{i:05d}.csv")
+                    keep = seen.add(result[side]) if drop else None
+                    kept[side] += result[f"n_{side}"] if keep is None else int(keep.sum())
+                    self._append_partition(out, part, keep, header=i == 0)
+
+        if drop:
+            seen.save(Path(self.config.row_hashes_file))
+        elif os.path.exists(self.config.row_hashes_file):
+            os.remove(self.config.row_hashes_file)
+        if os.path.exists(self.config.train_delta_file):
+            os.remove(self.config.train_delta_file)
+
+        rows = sum(result["rows"] for result in results)
+        logger.info("Splited %s shards into training and test sets", len(shards))
+        logger.info("Dropped %s duplicate rows out of %s",
+                    rows - kept["train"] - kept["test"], rows)
+        logger.info("Training data rows %s", kept["train"])
+        logger.info("Test data rows %s", kept["test"])
+
+
+    def _append_partition(self, out, part, keep, header: bool):
+        # partitions are copied as bytes, without parsing them, so every row keeps the
+        # text the worker wrote; dropped rows are filtered out line by line
+        with open(part, "rb") as f:
+            first = f.readline()
+            if header:
+                out.write(first)
+            if keep is None or keep.all():
+                shutil.copyfileobj(f, out, 1 << 20)
+            else:
+                out.writelines(itertools.compress(f, keep))
+
+
+    def append_new_rows(self):
+        """
+        Splits the rows found by incremental ingestion and appends them to `train.csv` and
+        `test.csv`, leaving every earlier assignment untouched. New rows are assigned by
+        the same feature hash as the full split, so a new duplicate of an existing row
+        joins the side its group is already on (or, with `duplicates: drop`, is dropped).
+        The new training rows are also written to `train_delta_file` for the incremental
+        trainer, and folded into the feature statistics without re-reading the training
+        set.
+        """
+        delta = read_typed_csv(self.config.delta_path, self.config.all_schema)
+        hashes = row_hashes(delta, self._feature_columns())
+        n_new = len(delta)
+        if self.config.duplicates == "drop":
+            seen = HashSet()
+            if os.path.exists(self.config.row_hashes_file):
+                seen = HashSet.load(Path(self.config.row_hashes_file))
+            first = seen.add(hashes)
+            delta, hashes = delta[first], hashes[first]
+        in_test = in_test_split(hashes, self.config.test_size)
+        train, test = delta[~in_test], delta[in_test]
+
+        # moments are merged exactly, the drift bins keep the reference from the last full run
+        content = None
+        if os.path.exists(self.config.feature_stats_file):
+            content = load_json(Path(self.config.feature_stats_file)).to_dict()
+            stats = RunningMoments.from_dict(content)
+            stats.update(train.drop([self.config.target_column], axis=1)[stats.columns])
+            for col, values in stats.to_dict()["columns"].items():
+                content["columns"][col].update(values)
+            content["count"] = stats.count
+
+        # Every output is rewritten to a temporary copy with the new rows appended, and the
+        # copies replace the outputs together once all of them are written. A failure
+        # before then leaves the outputs and the delta untouched, so the next run applies
+        # the same delta once instead of appending its rows a second time.
+        with ExitStack() as stack:
+            for path, rows in ((os.path.join(self.config.root_dir, "train.csv"), train),
+                               (os.path.join(self.config.root_dir, "test.csv"), test),
+                               (self.config.train_delta_file, train)):
+                f = stack.enter_context(atomic_write(path, "wb"))
+                exists = os.path.exists(path)
+                if exists:
+                    with open(path, "rb") as existing:
+                        shutil.copyfileobj(existing, f, 1 << 20)
+                f.write(rows.to_csv(header=not exists, index=False).encode())
+            if self.config.duplicates == "drop":
+                f = stack.enter_context(atomic_write(self.config.row_hashes_file, "wb"))
+                np.save(f, seen.hashes)
+            if content is not None:
+                f = stack.enter_context(atomic_write(self.config.feature_stats_file, "w",
+                                                     encoding="utf-8"))
+                json.dump(content, f, indent=4)
+        os.remove(self.config.delta_path)
+
+        logger.info("Appended %s new rows: %s to training, %s to test, %s duplicates dropped",
+                    n_new, len(train), len(test), n_new - len(delta))
+
+
+    def commit_ingestion_state(self):
+        """
+        Makes the watermark saved by incremental ingestion the one the next run compares
+        against. Called once the ingested data has been split, so a run that fails before
+        that leaves the previous watermark and its rows are ingested again.
+        """
+        if os.path.exists(self.config.pending_state_path):
+            os.replace(self.config.pending_state_path, self.config.state_path)
+            logger.info("Committed ingestion state to %s", self.config.state_path)
+
+
+    def fit_feature_stats(self):
+        """
+        Fits per-feature statistics (mean, variance, min, max) on the training split in a
+        single streaming pass over `train.csv`, and saves them to `feature_stats_file`.
+        These are used to standardize features for training and as the reference
+        statistics of the training data. A bounded row sample taken in the same pass
+        gives the quantile bin edges and reference bin fractions used for drift detection.
+        """
+        stats, sample = None, None
+        reader = read_typed_csv(os.path.join(self.config.root_dir, "train.csv"),
+                                self.config.all_schema, columns=self._feature_columns(),
+                                chunksize=self.config.chunk_size)
+        for features in reader:
+            if stats is None:
+                stats = RunningMoments(features.columns)
+                sample = BottomKSample(self.config.sample_size, len(stats.columns))
+            stats.update(features.to_numpy())
+            sample.update(features.to_numpy())
+
+        levels = np.linspace(0, 1, self.config.n_bins + 1)[1:-1]
+        edges = sample.quantiles(levels).T
+        fractions = bin_counts(edges, sample.rows) / len(sample.rows)
+
+        content = stats.to_dict()
+        for i, col in enumerate(stats.columns):
+            content["columns"][col]["bin_edges"] = edges[i].tolist()
+            content["columns"][col]["bin_fractions"] = fractions[i].tolist()
 
+        save_json(path=Path(self.config.feature_stats_file), data=content)
+        logger.info("Fitted feature statistics on %s training rows", stats.count)
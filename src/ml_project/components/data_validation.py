@@ -1,9 +1,63 @@
-# import os
+import os
+import time
+from pathlib import Path
 from ml_project import logger
 from ml_project.entity.config_entity import DataValidationConfig
+from ml_project.utils.common import save_json
+from ml_project.utils.data_loading import read_typed_csv
+from ml_project.utils.row_hashing import HashSet, row_hashes
+from ml_project.utils.sharding import load_shards, map_shards
 import pandas as pd
 
 
+def _validate_file(index: int, data_path, all_schema: dict) -> bool:
+    """
+    Validates the columns and data types of one file against the schema. Runs in a
+    worker process for the shards of a sharded run.
+    """
+    # the header is enough to check the columns
+    all_cols = set(pd.read_csv(data_path, nrows=0).columns)
+    schema_cols = set(all_schema.keys())
+
+    # Check for missing columns in the data
+    missing_cols = schema_cols.difference(all_cols)
+    if missing_cols:
+        for col in missing_cols:
+            logger.error(f"Missing column in dataset: {col}")
+        return False
+
+    # Check for extra columns in the data not present in the schema
+    extra_cols = all_cols.difference(schema_cols)
+    if extra_cols:
+        for col in extra_cols:
+            logger.error(f"Extra column in dataset: {col}")
+        return False
+
+    # Validate data types: every value must parse as its declared type
+    try:
+        read_typed_csv(data_path, all_schema)
+    except (ValueError, TypeError, OverflowError) as exc:
+        logger.error(f"Data type mismatch against schema {all_schema}: {exc}")
+        return False
+    return True
+
+
+def _distinct_hashes(index: int, data_path, all_schema: dict, target_column: str,
+                     chunk_size: int):
+    """
+    Streams one file and returns its row count with the distinct hashes of its feature
+    rows and of its full rows. Runs in a worker process for the shards of a sharded run.
+    """
+    columns = list(all_schema.keys())
+    features = [col for col in columns if col != target_column]
+    rows, distinct_features, distinct_rows = 0, HashSet(), HashSet()
+    for chunk in read_typed_csv(data_path, all_schema, chunksize=chunk_size):
+        rows += len(chunk)
+        distinct_features.add(row_hashes(chunk, features))
+        distinct_rows.add(row_hashes(chunk, columns))
+    return rows, distinct_features.hashes, distinct_rows.hashes
+
+
 class DataValidation:
     """
     A class for validating the columns and data types of a dataset against a predefined schema.
@@ -21,38 +75,38 @@ class DataValidation:
         """
         self.config = config
 
+    def _data_paths(self) -> list:
+        # every shard of a sharded run, else the new rows of an incremental run or the file
+        shards = load_shards(self.config.shards_file)
+        if shards is not None:
+            return shards
+        if os.path.exists(self.config.delta_path):
+            return [self.config.delta_path]
+        return [self.config.unzip_data_dir]
+
     def validate_all_columns(self) -> bool:
         """
         Validates if all columns in the dataset match the predefined schema and data types.
+        On an incremental run only the newly ingested rows are validated. The shards of a
+        sharded run are validated in parallel, and all of them must be valid.
 
         Returns:
             bool: True if all columns and their data types match the schema, False otherwise.
         """
         try:
-            data = pd.read_csv(self.config.unzip_data_dir)
-            all_cols = set(data.columns)
-            schema_cols = set(self.config.all_schema.keys())
-
-            # Check for missing columns in the data
-            missing_cols = schema_cols.difference(all_cols)
-            if missing_cols:
-                for col in missing_cols:
-                    logger.error(f"Missing column in dataset: {col}")
-                return False
+            data_paths = self._data_paths()
+            schema = dict(self.config.all_schema)
+            if len(data_paths) == 1:
+                results = [_validate_file(0, data_paths[0], schema)]
+            else:
+                results = map_shards(_validate_file, data_paths, self.config.n_jobs, schema)
 
-            # Check for extra columns in the data not present in the schema
-            extra_cols = all_cols.difference(schema_cols)
-            if extra_cols:
-                for col in extra_cols:
-                    logger.error(f"Extra column in dataset: {col}")
+            for data_path, valid in zip(data_paths, results):
+                if not valid:
+                    logger.error(f"Invalid data in {data_path}")
+            if not all(results):
                 return False
 
-            # Validate data types
-            for col, expected_type in self.config.all_schema.items():
-                if col in data and not pd.api.types.is_dtype_equal(data[col].dtype, expected_type):
-                    logger.error(f"Data type mismatch for column: {col}. Expected: {expected_type}, Found: {data[col].dtype}")
-                    return False
-
             logger.info("All columns and data types are valid.")
             return True
 
@@ -60,12 +114,55 @@ class DataValidation:
             logger.exception("Error during data validation")
             raise e
 
+    def count_duplicates(self) -> dict:
+        """
+        Counts duplicate rows in one streaming pass over the validated data and saves the
+        counts to `duplicates_file`. Rows are compared on their features alone and on
+        the full row, so rows sharing features but not the target are reported too.
+        Shards are hashed in parallel and their distinct hashes merged, so duplicates
+        across shards are counted as well.
+
+        Returns:
+            dict: The row and duplicate counts.
+        """
+        data_paths = self._data_paths()
+        args = (dict(self.config.all_schema), self.config.target_column, self.config.chunk_size)
+        if len(data_paths) == 1:
+            results = [_distinct_hashes(0, data_paths[0], *args)]
+        else:
+            results = map_shards(_distinct_hashes, data_paths, self.config.n_jobs, *args)
+
+        rows, distinct_features, distinct_rows = 0, HashSet(), HashSet()
+        for shard_rows, feature_hashes, full_hashes in results:
+            rows += shard_rows
+            distinct_features.add(feature_hashes)
+            distinct_rows.add(full_hashes)
+
+        counts = {
+            "data_path": str(data_paths[0]) if len(data_paths) == 1 else
+                         [str(path) for path in data_paths],
+            "rows": rows,
+            "distinct_rows": len(distinct_rows),
+            "duplicate_rows": rows - len(distinct_rows),
+            "distinct_feature_rows": len(distinct_features),
+            "duplicate_feature_rows": rows - len(distinct_features),
+            "feature_rows_with_conflicting_target": len(distinct_rows) - len(distinct_features),
+        }
+        save_json(path=Path(self.config.duplicates_file), data=counts)
+        logger.info("Found %s duplicate rows and %s rows with duplicate features out of %s",
+                    counts["duplicate_rows"], counts["duplicate_feature_rows"], rows)
+        return counts
+
     def _write_status(self, status: bool):
         """
-        Writes the validation status to the status file.
+        Writes the validation status to the status file, as JSON with the validated files
+        and the time of the validation.
 
         Parameters:
             status (bool): The validation status to be written to the file.
         """
-        with open(self.config.STATUS_FILE, 'w') as f:
-            f.write(f"Validation status: {status}")
+        save_json(path=Path(self.config.STATUS_FILE), data={
+            "validation_status": bool(status),
+            "data_paths": [str(path) for path in self._data_paths()],
+            "validated_at": time.time(),
+        })
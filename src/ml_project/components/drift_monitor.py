@@ -0,0 +1,204 @@
+import itertools
+import os
+import threading
+import time
+from pathlib import Path
+import numpy as np
+from ml_project import logger
+from ml_project.entity.config_entity import DriftMonitorConfig
+from ml_project.utils.common import load_json
+from ml_project.utils.feature_stats import (bin_counts, population_stability_index,
+                                            ks_statistic)
+
+
+class _Shard:
+    """
+    Streaming statistics of the requests served by the threads assigned to one slot of
+    the monitor's fixed shard pool. Sums are kept shifted by the reference mean to avoid
+    cancellation when the variance is computed.
+    """
+
+    def __init__(self, shift: np.ndarray, edges: np.ndarray):
+        self.lock = threading.Lock()
+        self.shift = shift
+        self.edges = edges
+        self.count = 0
+        self.sum = np.zeros_like(shift)
+        self.sum_sq = np.zeros_like(shift)
+        self.bins = np.zeros((edges.shape[0], edges.shape[1] + 1), dtype=np.int64)
+        self._flat_bins = self.bins.reshape(-1)
+        self._offsets = np.arange(edges.shape[0]) * self.bins.shape[1]
+
+    def update(self, data: np.ndarray):
+        with self.lock:
+            self._update(data)
+
+    def snapshot(self) -> tuple:
+        with self.lock:
+            return self.count, self.sum.copy(), self.sum_sq.copy(), self.bins.copy()
+
+    def _update(self, data: np.ndarray):
+        if data.shape[0] == 1:
+            # single-row fast path, the common case for /predict
+            row = data[0]
+            centered = row - self.shift
+            self.sum += centered
+            self.sum_sq += centered * centered
+            self._flat_bins[self._offsets + (row[:, None] >= self.edges).sum(axis=1)] += 1
+            self.count += 1
+            return
+        centered = data - self.shift
+        self.sum += centered.sum(axis=0)
+        self.sum_sq += (centered * centered).sum(axis=0)
+        self.bins += bin_counts(self.edges, data)
+        self.count += data.shape[0]
+
+
+class DriftMonitor:
+    """
+    Online feature drift monitor for the serving path.
+
+    Each request is folded into streaming statistics (count, mean, variance and a
+    histogram over the reference quantile bins) in O(1) per feature. The statistics are
+    split over a fixed pool of `N_SHARDS` shards, each with its own lock, and every
+    serving thread is assigned one shard round-robin the first time it observes, so
+    concurrent requests rarely contend and memory stays bounded however many threads
+    the server starts. A background thread periodically merges the shards and compares
+    them against the reference
+    statistics saved during data transformation, producing per-feature PSI and KS
+    scores that are read back without touching the request path.
+
+    Attributes:
+        config (DriftMonitorConfig): Configuration object containing settings for drift monitoring.
+        enabled (bool): False when no reference statistics exist, in which case observing is a no-op.
+    """
+
+    N_SHARDS = 16
+
+    def __init__(self, config: DriftMonitorConfig):
+        """
+        Initializes the DriftMonitor from the reference statistics file.
+
+        Parameters:
+            config (DriftMonitorConfig): The configuration for drift monitoring.
+        """
+        self.config = config
+        self.enabled = os.path.exists(config.reference_stats_file)
+        self._local = threading.local()
+        self._slots = itertools.count()
+        self._shards = []
+        self._stop = threading.Event()
+        self._thread = None
+        self._report = {"status": "no reference statistics"}
+
+        if not self.enabled:
+            logger.warning("Drift monitor disabled, missing reference statistics: %s",
+                           config.reference_stats_file)
+            return
+
+        reference = load_json(Path(config.reference_stats_file))
+        columns = reference["columns"]
+        self.columns = list(columns.keys())
+        self.reference_mean = np.array([columns[col]["mean"] for col in self.columns])
+        self.reference_var = np.array([columns[col]["var"] for col in self.columns])
+        self.edges = np.array([columns[col]["bin_edges"] for col in self.columns])
+        self.reference_fractions = np.array([columns[col]["bin_fractions"]
+                                             for col in self.columns])
+        self._shards = [_Shard(self.reference_mean, self.edges) for _ in range(self.N_SHARDS)]
+        self._report = {"status": "warming up", "count": 0}
+
+    def _shard(self) -> _Shard:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            # next() on itertools.count is atomic under the GIL
+            shard = self._shards[next(self._slots) % len(self._shards)]
+            self._local.shard = shard
+        return shard
+
+    def observe(self, data):
+        """
+        Folds the feature rows of a request into the calling thread's shard.
+
+        Parameters:
+            data (array-like): The request rows, of shape (n_rows, n_features).
+        """
+        if not self.enabled:
+            return
+        data = np.asarray(data, dtype=np.float64).reshape(-1, len(self.columns))
+        self._shard().update(data)
+
+    def refresh(self) -> dict:
+        """
+        Merges the shards' statistics and computes drift scores against the reference.
+
+        Returns:
+            dict: The drift report, also kept as the latest report.
+        """
+        if not self.enabled:
+            return self._report
+
+        counts, sums, sums_sq, bins = zip(*(shard.snapshot() for shard in self._shards))
+        count = sum(counts)
+        if count < self.config.min_samples:
+            self._report = {"status": "warming up", "count": count}
+            return self._report
+
+        total = sum(sums)
+        total_sq = sum(sums_sq)
+        bins = sum(bins)
+        shifted_mean = total / count
+        mean = self.reference_mean + shifted_mean
+        var = np.maximum(total_sq / count - shifted_mean ** 2, 0.0)
+        fractions = bins / bins.sum(axis=1, keepdims=True)
+        psi = population_stability_index(self.reference_fractions, fractions)
+        ks = ks_statistic(self.reference_fractions, fractions)
+
+        self._report = {
+            "status": "ok",
+            "count": int(count),
+            "updated_at": time.time(),
+            "features": {
+                col: {
+                    "mean": float(mean[i]),
+                    "var": float(var[i]),
+                    "reference_mean": float(self.reference_mean[i]),
+                    "reference_var": float(self.reference_var[i]),
+                    "psi": float(psi[i]),
+                    "ks": float(ks[i]),
+                }
+                for i, col in enumerate(self.columns)
+            },
+        }
+        return self._report
+
+    def report(self) -> dict:
+        """
+        Returns the latest drift report computed by the background thread.
+        """
+        return self._report
+
+    def start(self):
+        """
+        Starts the background thread that refreshes the drift report every
+        `report_interval` seconds.
+        """
+        if not self.enabled or self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="drift-monitor", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stops the background thread.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.config.report_interval):
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception("Error while refreshing the drift report")
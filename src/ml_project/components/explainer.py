@@ -0,0 +1,96 @@
+import os
+from pathlib import Path
+import numpy as np
+from ml_project.entity.config_entity import ExplainerConfig
+from ml_project.utils.common import load_json
+
+
+class LinearExplainer:
+    """
+    Exact per-feature explanations of a linear model's predictions.
+
+    The contribution of feature `j` to a row `x` is `coef[j] * (x[j] - mean[j])`, taken
+    relative to the training-mean baseline saved during data transformation, so the
+    contributions of a row sum to its prediction minus the baseline prediction. A whole
+    batch is explained with one broadcasted operation.
+
+    Attributes:
+        columns (list): The feature names, in matrix column order.
+        coef (np.ndarray): The model coefficients, in `columns` order.
+        mean (np.ndarray): The training mean of each feature, in `columns` order.
+        baseline (float): The prediction for the training-mean row.
+    """
+
+    def __init__(self, coef, intercept: float, mean, columns):
+        """
+        Initializes the explainer.
+
+        Parameters:
+            coef (array-like): The model coefficients, in `columns` order.
+            intercept (float): The model intercept.
+            mean (array-like): The training mean of each feature, in `columns` order.
+            columns (list): The feature names, in matrix column order.
+        """
+        self.columns = list(columns)
+        self.coef = np.asarray(coef, dtype=np.float64)
+        self.mean = np.asarray(mean, dtype=np.float64)
+        self.baseline = float(intercept + self.coef @ self.mean)
+
+    def contributions(self, matrix, out=None) -> np.ndarray:
+        """
+        Computes the contribution of every feature for every row.
+
+        Args:
+            matrix (array-like): The features, of shape (n_rows, n_features).
+            out (np.ndarray, optional): A float64 buffer of the same shape to write into.
+
+        Returns:
+            np.ndarray: The contributions, of shape (n_rows, n_features).
+        """
+        out = np.subtract(matrix, self.mean, out=out, dtype=np.float64)
+        return np.multiply(out, self.coef, out=out)
+
+    @staticmethod
+    def top_k(contributions: np.ndarray, k: int):
+        """
+        Selects the `k` largest contributions by magnitude of each row, sorted descending.
+
+        Args:
+            contributions (np.ndarray): The contributions, of shape (n_rows, n_features).
+            k (int): The number of features to keep per row.
+
+        Returns:
+            tuple: The feature indices and the contributions, both of shape (n_rows, k).
+        """
+        k = min(k, contributions.shape[1])
+        magnitude = np.abs(contributions)
+        index = np.argpartition(-magnitude, k - 1, axis=1)[:, :k]
+        order = np.argsort(-np.take_along_axis(magnitude, index, axis=1), axis=1)
+        index = np.take_along_axis(index, order, axis=1)
+        return index, np.take_along_axis(contributions, index, axis=1)
+
+
+_cache = {}
+
+def load_explainer(config: ExplainerConfig, pipeline) -> LinearExplainer:
+    """
+    Returns a LinearExplainer for the model of `pipeline`, rebuilt only when the model or
+    the baseline statistics file has changed.
+
+    Args:
+        config (ExplainerConfig): The configuration for explanations.
+        pipeline (PredictionPipeline): The pipeline holding a linear model.
+
+    Returns:
+        LinearExplainer: The explainer.
+    """
+    key = os.stat(config.baseline_stats_file).st_mtime_ns
+    cached = _cache.get(pipeline.model_version)
+    if cached is None or cached[0] != key:
+        columns = config.feature_columns
+        stats = load_json(Path(config.baseline_stats_file))["columns"]
+        coef, intercept = pipeline.linear_weights(columns)
+        mean = [stats[col]["mean"] for col in columns]
+        cached = (key, LinearExplainer(coef, intercept, mean, columns))
+        _cache[pipeline.model_version] = cached
+    return cached[1]
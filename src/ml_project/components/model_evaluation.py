@@ -1,4 +1,3 @@
-import pandas as pd
 from sklearn.metrics import mean_squared_error, mean_absolute_error, r2_score
 from urllib.parse import urlparse
 import mlflow
@@ -7,6 +6,7 @@ import numpy as np
 import joblib
 from ml_project.entity.config_entity import ModelEvaluationConfig
 from ml_project.utils.common import save_json
+from ml_project.utils.data_loading import read_typed_csv
 from pathlib import Path
 
 class ModelEvaluation:
@@ -23,7 +23,7 @@ class ModelEvaluation:
 
     def log_into_mlflow(self):
 
-        test_data = pd.read_csv(self.config.test_data_path)
+        test_data = read_typed_csv(self.config.test_data_path, self.config.all_schema)
         model = joblib.load(self.config.model_path)
 
         test_x = test_data.drop([self.config.target_column], axis=1)
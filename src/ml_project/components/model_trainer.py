@@ -1,28 +1,133 @@
+import numpy as np
 import pandas as pd
 import os
+import time
+from pathlib import Path
 from ml_project import logger
 from sklearn.linear_model import ElasticNet
 import joblib
 from ml_project.entity.config_entity import ModelTrainerConfig
+from ml_project.utils.common import load_json, save_json, atomic_write
+from ml_project.utils.data_loading import read_typed_csv
+from ml_project.utils.feature_stats import RunningMoments, fold_standardization
+from ml_project.utils.gram_stats import GramStatistics
 
 class ModelTrainer:
     def __init__(self, config: ModelTrainerConfig):
         self.config = config
 
-    
+
     def train(self):
-        train_data = pd.read_csv(self.config.train_data_path)
-        test_data = pd.read_csv(self.config.test_data_path)
+        model_path = os.path.join(self.config.root_dir, self.config.model_name)
+        if self.config.incremental and os.path.exists(self.config.train_delta_path) \
+                and os.path.exists(self.config.sufficient_stats_file) \
+                and os.path.exists(model_path):
+            return self.train_incremental()
 
+        # the test split is only needed by model evaluation
+        train_data = read_typed_csv(self.config.train_data_path, self.config.all_schema,
+                                    downcast=self.config.downcast)
 
         train_x = train_data.drop([self.config.target_column], axis=1)
-        test_x = test_data.drop([self.config.target_column], axis=1)
         train_y = train_data[[self.config.target_column]]
-        test_y = test_data[[self.config.target_column]]
+
+        # keep additive sufficient statistics so later incremental runs only read new rows
+        GramStatistics(train_x.shape[1]).update(train_x, train_y) \
+            .save(Path(self.config.sufficient_stats_file))
+
+        # Standardize with the statistics fitted during data transformation. The scaling
+        # is folded back into coef_/intercept_ before export, so serving is unchanged.
+        stats = None
+        if self.config.standardize:
+            stats = RunningMoments.from_dict(load_json(Path(self.config.feature_stats_file)))
+            mean = pd.Series(stats.mean, index=stats.columns)
+            scale = pd.Series(stats.scale, index=stats.columns)
+            train_x = (train_x - mean[train_x.columns]) / scale[train_x.columns]
 
 
         lr = ElasticNet(alpha=self.config.alpha, l1_ratio=self.config.l1_ratio, random_state=42)
+        start = time.perf_counter()
         lr.fit(train_x, train_y)
+        fit_seconds = time.perf_counter() - start
+
+        if stats is not None:
+            fold_standardization(lr, mean[train_x.columns], scale[train_x.columns])
+
+        report = {
+            "mode": "full",
+            "standardize": bool(self.config.standardize),
+            "downcast": bool(self.config.downcast),
+            "n_iter": int(lr.n_iter_),
+            "fit_seconds": fit_seconds,
+        }
+        if stats is not None:
+            report["scaler"] = {"mean": mean.to_dict(), "scale": scale.to_dict()}
+        save_json(path=Path(self.config.report_file_name), data=report)
+        logger.info("ElasticNet converged in %s iterations (%.4fs, standardize=%s)",
+                    report["n_iter"], fit_seconds, report["standardize"])
+
+        # replaced in one rename, so serving never loads a partially written model
+        with atomic_write(os.path.join(self.config.root_dir, self.config.model_name), "wb") as f:
+            joblib.dump(lr, f)
+
+
+    def train_incremental(self):
+        """
+        Retrains on the rows appended since the last run. The new training rows are added
+        to the saved sufficient statistics, and ElasticNet is solved on them warm-started
+        from the coefficients of the currently published model, so the cost depends on
+        the number of new rows rather than on the size of the history. A from-scratch
+        solve on the same statistics is run alongside for comparison in the report.
+        """
+        model_path = os.path.join(self.config.root_dir, self.config.model_name)
+        published = joblib.load(model_path)
+        columns = list(published.feature_names_in_)
+        delta = read_typed_csv(self.config.train_delta_path, self.config.all_schema,
+                               columns=columns + [self.config.target_column])
+        delta_x = delta[columns]
+        delta_y = delta[self.config.target_column]
+
+        stats = GramStatistics.load(Path(self.config.sufficient_stats_file))
+        stats.update(delta_x, delta_y)
+
+        start = time.perf_counter()
+        coef, intercept, n_iter = stats.solve_elastic_net(
+            self.config.alpha, self.config.l1_ratio, coef_init=np.ravel(published.coef_),
+            standardize=self.config.standardize)
+        fit_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        scratch_coef, scratch_intercept, scratch_n_iter = stats.solve_elastic_net(
+            self.config.alpha, self.config.l1_ratio, standardize=self.config.standardize)
+        scratch_seconds = time.perf_counter() - start
+
+        lr = ElasticNet(alpha=self.config.alpha, l1_ratio=self.config.l1_ratio, random_state=42)
+        lr.coef_ = coef
+        lr.intercept_ = np.array([intercept])
+        lr.n_iter_ = n_iter
+        lr.dual_gap_ = 0.0
+        lr.n_features_in_ = len(columns)
+        lr.feature_names_in_ = np.array(columns, dtype=object)
 
-        joblib.dump(lr, os.path.join(self.config.root_dir, self.config.model_name))
+        report = {
+            "mode": "incremental",
+            "standardize": bool(self.config.standardize),
+            "new_training_rows": int(len(delta)),
+            "total_rows": int(stats.count),
+            "n_iter": int(n_iter),
+            "fit_seconds": fit_seconds,
+            "from_scratch": {
+                "n_iter": int(scratch_n_iter),
+                "fit_seconds": scratch_seconds,
+                "max_abs_coef_diff": float(np.abs(coef - scratch_coef).max()),
+                "intercept_diff": float(intercept - scratch_intercept),
+            },
+        }
+        save_json(path=Path(self.config.report_file_name), data=report)
+        logger.info("Incremental fit on %s new rows converged in %s iterations "
+                    "(%s from scratch)", report["new_training_rows"], n_iter, scratch_n_iter)
 
+        stats.save(Path(self.config.sufficient_stats_file))
+        with atomic_write(model_path, "wb") as f:
+            joblib.dump(lr, f)
+        os.remove(self.config.train_delta_path)
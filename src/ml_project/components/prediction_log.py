@@ -0,0 +1,191 @@
+import atexit
+import glob
+import os
+import queue
+import threading
+import time
+from typing import Iterator
+import numpy as np
+from ml_project import logger
+from ml_project.entity.config_entity import PredictionLogConfig
+
+# every log file starts with this magic followed by the feature count as a little-endian int64
+LOG_MAGIC = b"MLPLOG01"
+HEADER_SIZE = len(LOG_MAGIC) + 8
+
+
+def record_dtype(n_features: int) -> np.dtype:
+    """
+    Returns the fixed-width little-endian record layout of the prediction log.
+
+    Args:
+        n_features (int): The number of model input features.
+
+    Returns:
+        np.dtype: A structured dtype of timestamp, features, model version and prediction.
+    """
+    return np.dtype([
+        ("timestamp", "<f8"),
+        ("features", "<f8", (n_features,)),
+        ("model_version", "S16"),
+        ("prediction", "<f8"),
+    ])
+
+
+class PredictionLogger:
+    """
+    Append-only prediction log written by a background thread.
+
+    Request threads only enqueue records. The writer drains the queue in batches, packs
+    them into fixed-width binary records and appends them to size-rotated files under
+    `root_dir`. When the queue is full, records are dropped and counted instead of
+    blocking the request thread.
+
+    Attributes:
+        config (PredictionLogConfig): Configuration object containing settings for the prediction log.
+        dropped (int): The number of records dropped because the queue was full.
+    """
+
+    def __init__(self, config: PredictionLogConfig):
+        """
+        Initializes the PredictionLogger with the given configuration.
+
+        Parameters:
+            config (PredictionLogConfig): The configuration for the prediction log.
+        """
+        self.config = config
+        self.dtype = record_dtype(config.n_features)
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+        self._queue = queue.Queue(maxsize=config.queue_size)
+        self._stop = threading.Event()
+        self._thread = None
+        self._file = None
+        self._file_bytes = 0
+        self._file_seq = 0
+
+    def log(self, features, predictions, model_version: str):
+        """
+        Enqueues served predictions without blocking.
+
+        Parameters:
+            features (array-like): The model inputs, of shape (n_rows, n_features).
+            predictions (array-like): The predictions, one per row.
+            model_version (str or array-like): The version of the model that served the
+                rows, or one version per row.
+        """
+        try:
+            self._queue.put_nowait((time.time(), features, predictions, model_version))
+        except queue.Full:
+            # `+=` is not atomic and many request threads can hit a full queue at once
+            with self._dropped_lock:
+                self.dropped += 1
+
+    def start(self) -> "PredictionLogger":
+        """
+        Starts the background writer, and stops it again at interpreter exit so queued
+        records are flushed.
+
+        Returns:
+            PredictionLogger: The logger itself.
+        """
+        if self._thread is None:
+            os.makedirs(self.config.root_dir, exist_ok=True)
+            self._thread = threading.Thread(target=self._run, name="prediction-log",
+                                            daemon=True)
+            self._thread.start()
+            atexit.register(self.stop)
+        return self
+
+    def stop(self):
+        """
+        Stops the background writer after it has drained the queue.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while True:
+            try:
+                batch = [self._queue.get(timeout=self.config.flush_interval)]
+            except queue.Empty:
+                if self._stop.is_set():
+                    break
+                continue
+            while len(batch) < self.config.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._write(self._pack(batch))
+            except Exception:
+                logger.exception("Error while writing %s prediction log entries", len(batch))
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _pack(self, batch) -> np.ndarray:
+        features = [np.asarray(f, dtype=np.float64).reshape(-1, self.config.n_features)
+                    for _, f, _, _ in batch]
+        sizes = [f.shape[0] for f in features]
+        records = np.empty(sum(sizes), dtype=self.dtype)
+        records["timestamp"] = np.repeat([ts for ts, _, _, _ in batch], sizes)
+        records["features"] = np.concatenate(features)
+        records["model_version"] = np.concatenate([
+            np.broadcast_to(np.asarray(v.encode() if isinstance(v, str) else v, dtype="S16"),
+                            (size,))
+            for (_, _, _, v), size in zip(batch, sizes)])
+        records["prediction"] = np.concatenate([np.asarray(p, dtype=np.float64).ravel()
+                                                for _, _, p, _ in batch])
+        return records
+
+    def _write(self, records: np.ndarray):
+        rotate = self._file_bytes + records.nbytes > self.config.max_file_bytes
+        if self._file is not None and rotate:
+            self._file.close()
+            self._file = None
+        if self._file is None:
+            self._open()
+        self._file.write(records.tobytes())
+        self._file.flush()
+        self._file_bytes += records.nbytes
+
+    def _open(self):
+        self._file_seq += 1
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        name = f"predictions-{stamp}-{os.getpid()}-{self._file_seq:04d}.bin"
+        path = os.path.join(self.config.root_dir, name)
+        self._file = open(path, "ab")
+        self._file.write(LOG_MAGIC + np.array(self.config.n_features, dtype="<i8").tobytes())
+        self._file_bytes = HEADER_SIZE
+        logger.info("Writing prediction log to %s", path)
+
+
+def read_prediction_logs(root_dir, chunk_rows: int = 1_000_000) -> Iterator[np.ndarray]:
+    """
+    Reads prediction log files back in chunks of records, memory-mapping each file so
+    only the chunk being processed is paged in.
+
+    Args:
+        root_dir: The directory holding the prediction log files.
+        chunk_rows (int, optional): The maximum number of records per chunk.
+
+    Yields:
+        np.ndarray: Structured arrays of records, see `record_dtype`.
+    """
+    for path in sorted(glob.glob(os.path.join(root_dir, "predictions-*.bin"))):
+        with open(path, "rb") as f:
+            header = f.read(HEADER_SIZE)
+        if len(header) < HEADER_SIZE or header[:len(LOG_MAGIC)] != LOG_MAGIC:
+            logger.warning("Skipping %s, not a prediction log file", path)
+            continue
+        dtype = record_dtype(int(np.frombuffer(header[len(LOG_MAGIC):], dtype="<i8")[0]))
+        n_records = (os.path.getsize(path) - HEADER_SIZE) // dtype.itemsize
+        if n_records == 0:
+            continue
+        records = np.memmap(path, dtype=dtype, mode="r", offset=HEADER_SIZE, shape=(n_records,))
+        for start in range(0, n_records, chunk_rows):
+            yield records[start:start + chunk_rows]
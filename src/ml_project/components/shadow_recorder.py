@@ -0,0 +1,133 @@
+import queue
+import threading
+import time
+import numpy as np
+from ml_project import logger
+from ml_project.entity.config_entity import ServingConfig
+
+
+class ShadowRecorder:
+    """
+    Compares every model's scores with the served predictions off the request path.
+
+    Request threads only enqueue the score matrix and the serving arm of each row. A
+    background thread drains the queue and accumulates, per model, how often it served
+    and how far its scores are from the served predictions. When the queue is full,
+    batches are dropped and counted instead of blocking the request thread.
+
+    Attributes:
+        config (ServingConfig): Configuration object containing settings for serving.
+        dropped (int): The number of batches dropped because the queue was full.
+    """
+
+    def __init__(self, config: ServingConfig):
+        """
+        Initializes the ShadowRecorder with the given configuration.
+
+        Parameters:
+            config (ServingConfig): The configuration for serving.
+        """
+        self.config = config
+        self.names = [model.name for model in config.models]
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+        n_models = len(self.names)
+        self._rows = 0
+        self._served = np.zeros(n_models, dtype=np.int64)
+        self._diff_sum = np.zeros(n_models)
+        self._diff_sq_sum = np.zeros(n_models)
+        self._diff_max = np.zeros(n_models)
+        self._queue = queue.Queue(maxsize=config.queue_size)
+        self._stop = threading.Event()
+        self._thread = None
+        self._report = {"status": "no traffic yet"}
+
+    def record(self, scores: np.ndarray, arms: np.ndarray):
+        """
+        Enqueues the scores of a request without blocking.
+
+        Parameters:
+            scores (np.ndarray): The scores of every model, of shape (n_rows, n_models).
+            arms (np.ndarray): The index of the model that served each row.
+        """
+        if scores.shape[1] < 2:
+            return
+        try:
+            self._queue.put_nowait((scores, arms))
+        except queue.Full:
+            # `+=` is not atomic and many request threads can hit a full queue at once
+            with self._dropped_lock:
+                self.dropped += 1
+
+    def start(self) -> "ShadowRecorder":
+        """
+        Starts the background thread.
+
+        Returns:
+            ShadowRecorder: The recorder itself.
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="shadow-recorder",
+                                            daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stops the background thread after it has drained the queue.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def report(self) -> dict:
+        """
+        Returns the latest comparison of every model against the served predictions.
+        """
+        return self._report
+
+    def _run(self):
+        last_report = time.monotonic()
+        while True:
+            try:
+                scores, arms = self._queue.get(timeout=1.0)
+                self._accumulate(scores, arms)
+            except queue.Empty:
+                if self._stop.is_set():
+                    break
+            except Exception:
+                logger.exception("Error while recording shadow scores")
+            if time.monotonic() - last_report >= self.config.shadow_report_interval \
+                    or self._stop.is_set():
+                self._refresh()
+                last_report = time.monotonic()
+        self._refresh()
+
+    def _accumulate(self, scores: np.ndarray, arms: np.ndarray):
+        scores = scores.astype(np.float64, copy=False)
+        served = scores[np.arange(len(arms)), arms]
+        diff = scores - served[:, None]
+        self._rows += len(arms)
+        self._served += np.bincount(arms, minlength=len(self.names))
+        self._diff_sum += diff.sum(axis=0)
+        self._diff_sq_sum += (diff * diff).sum(axis=0)
+        self._diff_max = np.maximum(self._diff_max, np.abs(diff).max(axis=0))
+
+    def _refresh(self):
+        if self._rows == 0:
+            return
+        self._report = {
+            "rows": int(self._rows),
+            "dropped_batches": int(self.dropped),
+            "updated_at": time.time(),
+            "models": {
+                name: {
+                    "served_rows": int(self._served[i]),
+                    "mean_diff_vs_served": float(self._diff_sum[i] / self._rows),
+                    "rmse_vs_served": float(np.sqrt(self._diff_sq_sum[i] / self._rows)),
+                    "max_abs_diff_vs_served": float(self._diff_max[i]),
+                }
+                for i, name in enumerate(self.names)
+            },
+        }
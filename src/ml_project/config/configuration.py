@@ -1,10 +1,17 @@
+import os
 from ml_project.constants import *
 from ml_project.utils.common import read_yaml, create_directories
 from ml_project.entity.config_entity import (DataIngestionConfig,
                                             DataValidationConfig,
                                             DataTransformationConfig,
                                             ModelTrainerConfig,
-                                            ModelEvaluationConfig)
+                                            ModelEvaluationConfig,
+                                            CrossValidationConfig,
+                                            DriftMonitorConfig,
+                                            PredictionLogConfig,
+                                            ServingConfig,
+                                            ExplainerConfig,
+                                            ProfilingConfig)
 
 class ConfigurationManager:
     def __init__(
@@ -29,7 +36,17 @@ class ConfigurationManager:
             root_dir=config.root_dir,
             source_URL=config.source_URL,
             local_data_file=config.local_data_file,
-            unzip_dir=config.unzip_dir 
+            download_state_file=config.download_state_file,
+            unzip_dir=config.unzip_dir,
+            data_file=config.data_file,
+            state_file=config.state_file,
+            pending_state_file=config.pending_state_file,
+            delta_file=config.delta_file,
+            incremental=self.params.Incremental.enabled,
+            sources=list(config.sources),
+            shard_dir=config.shard_dir,
+            shards_file=config.shards_file,
+            max_workers=config.max_workers,
         )
 
         return data_ingestion_config
@@ -38,6 +55,7 @@ class ConfigurationManager:
     def get_data_validation_config(self) -> DataValidationConfig:
         config = self.config.data_validation
         schema = self.schema.COLUMNS
+        target = self.schema.TARGET_COLUMN
 
         create_directories([config.root_dir])
 
@@ -45,7 +63,13 @@ class ConfigurationManager:
             root_dir=config.root_dir,
             STATUS_FILE=config.STATUS_FILE,
             unzip_data_dir=config.unzip_data_dir,
+            delta_path=config.delta_path,
             all_schema=schema,
+            target_column=target.name,
+            duplicates_file=config.duplicates_file,
+            chunk_size=config.chunk_size,
+            shards_file=config.shards_file,
+            n_jobs=config.n_jobs,
         )
 
         return data_validation_config
@@ -53,12 +77,29 @@ class ConfigurationManager:
 
     def get_data_transformation_config(self) -> DataTransformationConfig:
         config = self.config.data_transformation
+        schema = self.schema.TARGET_COLUMN
 
         create_directories([config.root_dir])
 
         data_transformation_config = DataTransformationConfig(
             root_dir=config.root_dir,
             data_path=config.data_path,
+            delta_path=config.delta_path,
+            state_path=config.state_path,
+            pending_state_path=config.pending_state_path,
+            train_delta_file=config.train_delta_file,
+            test_size=config.test_size,
+            feature_stats_file=config.feature_stats_file,
+            chunk_size=config.chunk_size,
+            sample_size=config.sample_size,
+            n_bins=config.n_bins,
+            target_column=schema.name,
+            all_schema=self.schema.COLUMNS,
+            duplicates=config.duplicates,
+            row_hashes_file=config.row_hashes_file,
+            shards_file=config.shards_file,
+            partitions_dir=config.partitions_dir,
+            n_jobs=config.n_jobs,
         )
 
         return data_transformation_config
@@ -67,6 +108,7 @@ class ConfigurationManager:
     def get_model_trainer_config(self) -> ModelTrainerConfig:
         config = self.config.model_trainer
         params = self.params.ElasticNet
+        preprocessing = self.params.Preprocessing
         schema =  self.schema.TARGET_COLUMN
 
         create_directories([config.root_dir])
@@ -75,10 +117,18 @@ class ConfigurationManager:
             root_dir=config.root_dir,
             train_data_path = config.train_data_path,
             test_data_path = config.test_data_path,
+            train_delta_path = config.train_delta_path,
             model_name = config.model_name,
             alpha = params.alpha,
             l1_ratio = params.l1_ratio,
-            target_column = schema.name
+            target_column = schema.name,
+            standardize = preprocessing.standardize,
+            incremental = self.params.Incremental.enabled,
+            feature_stats_file = config.feature_stats_file,
+            report_file_name = config.report_file_name,
+            sufficient_stats_file = config.sufficient_stats_file,
+            all_schema = self.schema.COLUMNS,
+            downcast = preprocessing.downcast
         )
         return model_trainer_config
     
@@ -98,5 +148,103 @@ class ConfigurationManager:
             metric_file_name = config.metric_file_name,
             target_column = schema.name,
             mlflow_uri="https://dagshub.com/gyannetics/mlops-end-to-end.mlflow",   
+            all_schema=self.schema.COLUMNS,
         )
         return model_evaluation_config
+    
+
+    def get_cross_validation_config(self) -> CrossValidationConfig:
+        config = self.config.cross_validation
+        params = self.params
+        schema = self.schema.TARGET_COLUMN
+
+        create_directories([config.root_dir, os.path.dirname(config.metric_file_name)])
+
+        cross_validation_config = CrossValidationConfig(
+            root_dir=config.root_dir,
+            train_data_path=config.train_data_path,
+            test_data_path=config.test_data_path,
+            metric_file_name=config.metric_file_name,
+            target_column=schema.name,
+            enabled=params.CrossValidation.enabled,
+            n_splits=params.CrossValidation.n_splits,
+            n_jobs=config.n_jobs,
+            alpha=params.ElasticNet.alpha,
+            l1_ratio=params.ElasticNet.l1_ratio,
+            standardize=params.Preprocessing.standardize,
+            all_schema=self.schema.COLUMNS,
+        )
+        return cross_validation_config
+
+
+    def get_drift_monitor_config(self) -> DriftMonitorConfig:
+        config = self.config.drift_monitor
+
+        drift_monitor_config = DriftMonitorConfig(
+            reference_stats_file=config.reference_stats_file,
+            report_interval=config.report_interval,
+            min_samples=config.min_samples,
+        )
+        return drift_monitor_config
+
+
+    def get_prediction_log_config(self) -> PredictionLogConfig:
+        config = self.config.prediction_log
+        schema = self.schema
+
+        create_directories([config.root_dir])
+
+        prediction_log_config = PredictionLogConfig(
+            root_dir=config.root_dir,
+            n_features=len(schema.COLUMNS) - 1,
+            max_file_bytes=config.max_file_bytes,
+            batch_size=config.batch_size,
+            flush_interval=config.flush_interval,
+            queue_size=config.queue_size,
+            replay_report_file=config.replay_report_file,
+        )
+        return prediction_log_config
+
+
+    def get_serving_config(self) -> ServingConfig:
+        config = self.config.serving
+        schema = self.schema
+
+        weights = [float(model.get("weight", 0.0)) for model in config.models]
+        if min(weights) < 0:
+            raise ValueError("Serving model weights must not be negative")
+        if max(weights) > 0 and weights[0] <= 0:
+            raise ValueError(f"The primary model {config.models[0].name} must have a weight "
+                             "above 0 when other models have one, shadows come after it")
+
+        serving_config = ServingConfig(
+            models=config.models,
+            feature_columns=[col for col in schema.COLUMNS if col != schema.TARGET_COLUMN.name],
+            queue_size=config.queue_size,
+            shadow_report_interval=config.shadow_report_interval,
+        )
+        return serving_config
+
+
+    def get_explainer_config(self) -> ExplainerConfig:
+        config = self.config.explainer
+        schema = self.schema
+
+        explainer_config = ExplainerConfig(
+            baseline_stats_file=config.baseline_stats_file,
+            feature_columns=[col for col in schema.COLUMNS if col != schema.TARGET_COLUMN.name],
+            default_top_k=config.default_top_k,
+            all_schema=schema.COLUMNS,
+        )
+        return explainer_config
+
+
+    def get_profiling_config(self) -> ProfilingConfig:
+        config = self.config.profiling
+
+        profiling_config = ProfilingConfig(
+            root_dir=config.root_dir,
+            sample_interval=config.sample_interval,
+            top_n=config.top_n,
+        )
+        return profiling_config
@@ -7,19 +7,51 @@ class DataIngestionConfig:
     root_dir: Path
     source_URL: str
     local_data_file: Path
+    download_state_file: Path
     unzip_dir: Path
+    data_file: Path
+    state_file: Path
+    pending_state_file: Path
+    delta_file: Path
+    incremental: bool
+    sources: list
+    shard_dir: Path
+    shards_file: Path
+    max_workers: int
     
 @dataclass(frozen=True)
 class DataValidationConfig:
     root_dir: Path
     STATUS_FILE: str
     unzip_data_dir: Path
+    delta_path: Path
     all_schema: dict
+    target_column: str
+    duplicates_file: Path
+    chunk_size: int
+    shards_file: Path
+    n_jobs: int
     
 @dataclass(frozen=True)
 class DataTransformationConfig:
     root_dir: Path
     data_path: Path
+    delta_path: Path
+    state_path: Path
+    pending_state_path: Path
+    train_delta_file: Path
+    test_size: float
+    feature_stats_file: Path
+    chunk_size: int
+    sample_size: int
+    n_bins: int
+    target_column: str
+    all_schema: dict
+    duplicates: str
+    row_hashes_file: Path
+    shards_file: Path
+    partitions_dir: Path
+    n_jobs: int
     
     
 @dataclass(frozen=True)
@@ -27,10 +59,18 @@ class ModelTrainerConfig:
     root_dir: Path
     train_data_path: Path
     test_data_path: Path
+    train_delta_path: Path
     model_name: str
     alpha: float
     l1_ratio: float
     target_column: str
+    standardize: bool
+    incremental: bool
+    feature_stats_file: Path
+    report_file_name: Path
+    sufficient_stats_file: Path
+    all_schema: dict
+    downcast: bool
     
 @dataclass(frozen=True)
 class ModelEvaluationConfig:
@@ -40,4 +80,62 @@ class ModelEvaluationConfig:
     all_params: dict
     metric_file_name: Path
     target_column: str
-    mlflow_uri: str
\ No newline at end of file
+    mlflow_uri: str
+    all_schema: dict
+
+
+@dataclass(frozen=True)
+class CrossValidationConfig:
+    root_dir: Path
+    train_data_path: Path
+    test_data_path: Path
+    metric_file_name: Path
+    target_column: str
+    enabled: bool
+    n_splits: int
+    n_jobs: int
+    alpha: float
+    l1_ratio: float
+    standardize: bool
+    all_schema: dict
+
+
+@dataclass(frozen=True)
+class DriftMonitorConfig:
+    reference_stats_file: Path
+    report_interval: float
+    min_samples: int
+
+
+@dataclass(frozen=True)
+class PredictionLogConfig:
+    root_dir: Path
+    n_features: int
+    max_file_bytes: int
+    batch_size: int
+    flush_interval: float
+    queue_size: int
+    replay_report_file: Path
+
+
+@dataclass(frozen=True)
+class ServingConfig:
+    models: list
+    feature_columns: list
+    queue_size: int
+    shadow_report_interval: float
+
+
+@dataclass(frozen=True)
+class ExplainerConfig:
+    baseline_stats_file: Path
+    feature_columns: list
+    default_top_k: int
+    all_schema: dict
+
+
+@dataclass(frozen=True)
+class ProfilingConfig:
+    root_dir: Path
+    sample_interval: float
+    top_n: int
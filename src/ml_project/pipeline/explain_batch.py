@@ -0,0 +1,73 @@
+import argparse
+from pathlib import Path
+import numpy as np
+import pandas as pd
+from ml_project.config.configuration import ConfigurationManager
+from ml_project.components.explainer import load_explainer
+from ml_project.utils.common import atomic_write
+from ml_project.utils.data_loading import read_typed_csv
+from ml_project.pipeline.prediction import MODEL_PATH, load_prediction_pipeline
+from ml_project import logger
+
+
+STAGE_NAME = "Batch Explanation"
+
+class BatchExplanationPipeline:
+    """
+    Explains the predictions of a model for every row of a CSV file, chunk by chunk, and
+    writes the per-feature contributions (or the top-k of each row) to a CSV file.
+    """
+    def __init__(self, data_path, output_path, model_path=MODEL_PATH, top_k=0,
+                 chunk_rows=1_000_000):
+        self.data_path = data_path
+        self.output_path = output_path
+        self.model_path = model_path
+        self.top_k = top_k
+        self.chunk_rows = chunk_rows
+
+    def main(self):
+        config = ConfigurationManager()
+        explainer_config = config.get_explainer_config()
+        explainer = load_explainer(explainer_config, load_prediction_pipeline(self.model_path))
+        columns = explainer_config.feature_columns
+
+        rows = 0
+        reader = read_typed_csv(self.data_path, explainer_config.all_schema, columns=columns,
+                                chunksize=self.chunk_rows)
+        with atomic_write(self.output_path, "w", encoding="utf-8", newline="") as output:
+            for chunk in reader:
+                contributions = explainer.contributions(chunk.to_numpy())
+                out = pd.DataFrame({"prediction": explainer.baseline + contributions.sum(axis=1)})
+                if self.top_k > 0:
+                    index, values = explainer.top_k(contributions, self.top_k)
+                    names = np.asarray(columns)[index]
+                    for k in range(index.shape[1]):
+                        out[f"top_{k + 1}_feature"] = names[:, k]
+                        out[f"top_{k + 1}_contribution"] = values[:, k]
+                else:
+                    for j, col in enumerate(columns):
+                        out[col] = contributions[:, j]
+                out.to_csv(output, header=rows == 0, index=False)
+                rows += len(out)
+
+        logger.info("Explained %s rows from %s into %s (baseline %.4f)",
+                    rows, self.data_path, self.output_path, explainer.baseline)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Explain model predictions for a CSV file")
+    parser.add_argument("data_path")
+    parser.add_argument("output_path")
+    parser.add_argument("--model", default=str(MODEL_PATH))
+    parser.add_argument("--top-k", type=int, default=0)
+    parser.add_argument("--chunk-rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+    try:
+        logger.info(">>>>> %s Started <<<<<", STAGE_NAME)
+        obj = BatchExplanationPipeline(args.data_path, args.output_path, Path(args.model),
+                                       args.top_k, args.chunk_rows)
+        obj.main()
+        logger.info(">>>>> %s Completed <<<<<", STAGE_NAME)
+    except Exception as e:
+        logger.exception(e)
+        raise e
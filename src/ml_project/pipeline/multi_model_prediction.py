@@ -0,0 +1,99 @@
+from pathlib import Path
+import numpy as np
+from ml_project.entity.config_entity import ServingConfig
+from ml_project.pipeline.prediction import load_prediction_pipeline
+
+
+class MultiModelPredictionPipeline:
+    """
+    Serves several model versions at once: a primary, weighted A/B arms and shadows.
+
+    The coefficients of all (linear) models are stacked into one matrix, so every version
+    is scored with a single matrix product per request or batch. Each row is then served
+    by an arm drawn by weight, and the full score matrix is available to compare shadows.
+    """
+    def __init__(self, config: ServingConfig, pipelines):
+        self.config = config
+        self.pipelines = pipelines
+        self.names = [model.name for model in config.models]
+        self.model_versions = np.array([p.model_version for p in pipelines], dtype="S16")
+
+        weights = np.array([float(model.get("weight", 0.0)) for model in config.models])
+        if weights.sum() <= 0:
+            weights[0] = 1.0
+        self.weights = weights / weights.sum()
+        self._cum_weights = np.cumsum(self.weights)
+        arms = np.flatnonzero(weights)
+        self._single_arm = int(arms[0]) if len(arms) == 1 else None
+        self._linear = all(hasattr(p.model, "coef_") for p in pipelines)
+        self._stacked = {}
+        self._rng = np.random.default_rng()
+
+
+    def _stacked_weights(self, dtype):
+        if dtype.str not in self._stacked:
+            columns = self.config.feature_columns
+            weights = [p.linear_weights(columns, dtype) for p in self.pipelines]
+            coef = np.column_stack([c for c, _ in weights])
+            intercept = np.array([b for _, b in weights], dtype=dtype)
+            self._stacked[dtype.str] = (coef, intercept)
+        return self._stacked[dtype.str]
+
+
+    def score(self, matrix: np.ndarray) -> np.ndarray:
+        """
+        Scores a feature matrix in `feature_columns` order with every model.
+
+        Args:
+            matrix (np.ndarray): The features, of shape (n_rows, n_features).
+
+        Returns:
+            np.ndarray: The scores, of shape (n_rows, n_models).
+        """
+        if self._linear:
+            coef, intercept = self._stacked_weights(matrix.dtype)
+            return matrix @ coef + intercept
+        return np.column_stack([p.predict_raw(matrix, self.config.feature_columns)
+                                for p in self.pipelines])
+
+
+    def predict(self, matrix: np.ndarray):
+        """
+        Scores a feature matrix with every model and picks the served prediction of each
+        row from the arm it is assigned to.
+
+        Args:
+            matrix (np.ndarray): The features, of shape (n_rows, n_features).
+
+        Returns:
+            tuple: The served predictions, the index of the serving model of each row and
+            the full (n_rows, n_models) score matrix.
+        """
+        scores = self.score(matrix)
+        n_rows = scores.shape[0]
+        if self._single_arm is not None:
+            return scores[:, self._single_arm], np.full(n_rows, self._single_arm), scores
+        arms = np.searchsorted(self._cum_weights, self._rng.random(n_rows), side="right")
+        arms = np.minimum(arms, len(self.pipelines) - 1)
+        return scores[np.arange(n_rows), arms], arms, scores
+
+
+_cache = {}
+
+def load_multi_model_pipeline(config: ServingConfig) -> MultiModelPredictionPipeline:
+    """
+    Returns a MultiModelPredictionPipeline for the configured models, rebuilding the
+    stacked coefficients only when one of the model files has changed. Pipelines are
+    cached per model list (names, paths and weights) and invalidated by the versions of
+    the models, which `load_prediction_pipeline` reloads when a file's mtime or size
+    changes.
+    """
+    pipelines = [load_prediction_pipeline(Path(model.path)) for model in config.models]
+    versions = tuple(p.model_version for p in pipelines)
+    key = tuple((model.name, str(model.path), float(model.get("weight", 0.0)))
+                for model in config.models)
+    cached = _cache.get(key)
+    if cached is None or cached[0] != versions:
+        cached = (versions, MultiModelPredictionPipeline(config, pipelines))
+        _cache[key] = cached
+    return cached[1]
@@ -1,15 +1,81 @@
+import hashlib
+import io
+import os
 import joblib 
 import numpy as np
 import pandas as pd
 from pathlib import Path
 
 
+MODEL_PATH = Path('artifacts/model_trainer/model.joblib')
+
+
 class PredictionPipeline:
-    def __init__(self):
-        self.model = joblib.load(Path('artifacts/model_trainer/model.joblib'))
+    def __init__(self, model_path=MODEL_PATH):
+        with open(model_path, 'rb') as f:
+            content = f.read()
+        # content hash of the served model, recorded with every logged prediction
+        self.model_version = hashlib.sha1(content).hexdigest()[:16]
+        self.model = joblib.load(io.BytesIO(content))
+        self._weights = {}
 
     
     def predict(self, data):
         prediction = self.model.predict(data)
 
-        return prediction
\ No newline at end of file
+        return prediction
+
+
+    def predict_raw(self, matrix: np.ndarray, columns) -> np.ndarray:
+        """
+        Scores a raw feature matrix whose columns are laid out in `columns` order.
+
+        Linear models are scored with a single matrix-vector product in the matrix's own
+        dtype, with the coefficients permuted to `columns` order once and cached, so the
+        (possibly read-only, zero-copy) matrix is never reordered or upcast.
+
+        Args:
+            matrix (np.ndarray): The features, of shape (n_rows, len(columns)).
+            columns (list): The feature names of the matrix columns.
+
+        Returns:
+            np.ndarray: One prediction per row, in the matrix's dtype for linear models.
+        """
+        if not hasattr(self.model, "coef_"):
+            return self.model.predict(pd.DataFrame(matrix, columns=columns))
+
+        coef, intercept = self.linear_weights(columns, matrix.dtype)
+        return matrix @ coef + intercept
+
+
+    def linear_weights(self, columns, dtype=np.float64):
+        """
+        Returns the coefficients of a linear model permuted to `columns` order and its
+        intercept, both in `dtype`. The result is cached per column order and dtype.
+        """
+        dtype = np.dtype(dtype)
+        key = (tuple(columns), dtype.str)
+        if key not in self._weights:
+            coef = np.ravel(self.model.coef_)
+            names = list(getattr(self.model, "feature_names_in_", columns))
+            coef = coef[[names.index(col) for col in columns]]
+            intercept = float(np.ravel(self.model.intercept_)[0])
+            self._weights[key] = (coef.astype(dtype), dtype.type(intercept))
+        return self._weights[key]
+
+
+_cache = {}
+
+def load_prediction_pipeline(model_path=MODEL_PATH) -> PredictionPipeline:
+    """
+    Returns a PredictionPipeline for `model_path`, loading the model only when the file
+    has changed since the last call, so a retrained model is picked up without reloading
+    it on every request.
+    """
+    stat = os.stat(model_path)
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _cache.get(model_path)
+    if cached is None or cached[0] != key:
+        cached = (key, PredictionPipeline(model_path))
+        _cache[model_path] = cached
+    return cached[1]
@@ -0,0 +1,65 @@
+import argparse
+from pathlib import Path
+import joblib
+import numpy as np
+from ml_project.config.configuration import ConfigurationManager
+from ml_project.components.prediction_log import read_prediction_logs
+from ml_project.utils.common import save_json
+from ml_project import logger
+
+
+STAGE_NAME = "Prediction Replay"
+
+class PredictionReplayPipeline:
+    """
+    Re-scores the logged predictions against another model, chunk by chunk, and reports
+    how far the new predictions are from the ones that were served.
+    """
+    def __init__(self, model_path=Path('artifacts/model_trainer/model.joblib'),
+                 chunk_rows=1_000_000):
+        self.model_path = model_path
+        self.chunk_rows = chunk_rows
+
+    def main(self):
+        config = ConfigurationManager()
+        prediction_log_config = config.get_prediction_log_config()
+        model = joblib.load(self.model_path)
+
+        rows, abs_diff, sq_diff, max_diff = 0, 0.0, 0.0, 0.0
+        versions = set()
+        for records in read_prediction_logs(prediction_log_config.root_dir, self.chunk_rows):
+            # predict on the raw matrix, the same way the serving path does
+            rescored = model.predict(np.asarray(records["features"]))
+            diff = rescored - records["prediction"]
+            rows += len(records)
+            abs_diff += float(np.abs(diff).sum())
+            sq_diff += float((diff * diff).sum())
+            max_diff = max(max_diff, float(np.abs(diff).max()))
+            versions.update(np.unique(records["model_version"]).tolist())
+
+        report = {
+            "model_path": str(self.model_path),
+            "rows": rows,
+            "served_model_versions": sorted(v.decode() for v in versions),
+            "mean_abs_diff": abs_diff / rows if rows else 0.0,
+            "rmse_diff": float(np.sqrt(sq_diff / rows)) if rows else 0.0,
+            "max_abs_diff": max_diff,
+        }
+        save_json(path=Path(prediction_log_config.replay_report_file), data=report)
+        logger.info("Replayed %s logged predictions against %s", rows, self.model_path)
+        return report
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Re-score logged predictions offline")
+    parser.add_argument("--model", default="artifacts/model_trainer/model.joblib")
+    parser.add_argument("--chunk-rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+    try:
+        logger.info(">>>>> %s Started <<<<<", STAGE_NAME)
+        obj = PredictionReplayPipeline(model_path=Path(args.model), chunk_rows=args.chunk_rows)
+        obj.main()
+        logger.info(">>>>> %s Completed <<<<<", STAGE_NAME)
+    except Exception as e:
+        logger.exception(e)
+        raise e
@@ -1,5 +1,6 @@
 from ml_project.config.configuration import ConfigurationManager
 from ml_project.components.data_ingestion import DataIngestion
+from ml_project.utils.common import artifact_lock
 from ml_project import logger
 
 STAGE_NAME = 'Data Ingestion Stage'
@@ -12,8 +13,13 @@ class DataIngestionTrainingPipeline:
         config = ConfigurationManager()
         data_ingestion_config = config.get_data_ingestion_config()
         data_ingestion = DataIngestion(config=data_ingestion_config)
-        data_ingestion.download_file()
-        data_ingestion.extract_zip_file()
+        with artifact_lock(exclusive=[data_ingestion_config.root_dir]):
+            if data_ingestion_config.sources:
+                data_ingestion.ingest_shards()
+            else:
+                data_ingestion.download_file()
+                data_ingestion.extract_zip_file()
+                data_ingestion.detect_new_rows()
 
 
 if __name__ == '__main__':
@@ -1,7 +1,9 @@
 # from main import STAGE_NAME
 from ml_project.config.configuration import ConfigurationManager
 from ml_project.components.data_validation import DataValidation
+from ml_project.utils.common import artifact_lock
 from ml_project import logger
+import os
 
 
 STAGE_NAME = "Data Validation Stage"
@@ -14,8 +16,12 @@ class DataValidationTrainingPipeline:
         config = ConfigurationManager()
         data_validation_config = config.get_data_validation_config()
         data_validation = DataValidation(config=data_validation_config)
-        validation_result = data_validation.validate_all_columns()
-        data_validation._write_status(status=validation_result)
+        with artifact_lock(shared=[os.path.dirname(data_validation_config.unzip_data_dir)],
+                           exclusive=[data_validation_config.root_dir]):
+            validation_result = data_validation.validate_all_columns()
+            data_validation._write_status(status=validation_result)
+            if validation_result:
+                data_validation.count_duplicates()
         
 
 if __name__ == "__main__":
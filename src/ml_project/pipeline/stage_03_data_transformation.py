@@ -1,7 +1,9 @@
 from ml_project.components.data_transformation import DataTransformation
 from ml_project import logger
+import os
 from pathlib import Path
 from ml_project.config.configuration import ConfigurationManager
+from ml_project.utils.common import artifact_lock, load_json
 
 
 
@@ -13,20 +15,34 @@ class DataTransformationTrainingPipeline:
 
     def main(self):
         try:
-            with open(Path("artifacts/data_validation/status.txt"), "r") as f:
-                status = f.read().split(" ")[-1]
-
-            if status == "True":
-                config = ConfigurationManager()
-                data_transformation_config = config.get_data_transformation_config()
-                data_transformation = DataTransformation(config=data_transformation_config)
-                data_transformation.train_test_spliting()
-
-            else:
-                raise Exception("You data schema is not valid")
+            config = ConfigurationManager()
+            data_validation_config = config.get_data_validation_config()
+            data_transformation_config = config.get_data_transformation_config()
+            # appending new rows consumes the ingested delta file, hence the exclusive lock
+            with artifact_lock(shared=[data_validation_config.root_dir],
+                               exclusive=[os.path.dirname(data_transformation_config.data_path),
+                                          data_transformation_config.root_dir]):
+                status = load_json(Path(data_validation_config.STATUS_FILE))
+
+                if status.validation_status:
+                    data_transformation = DataTransformation(config=data_transformation_config)
+                    train_path = Path(data_transformation_config.root_dir, "train.csv")
+                    if os.path.exists(data_transformation_config.shards_file):
+                        data_transformation.split_shards()
+                        data_transformation.fit_feature_stats()
+                    elif os.path.exists(data_transformation_config.delta_path) and train_path.exists():
+                        data_transformation.append_new_rows()
+                    else:
+                        data_transformation.train_test_spliting()
+                        data_transformation.fit_feature_stats()
+                    data_transformation.commit_ingestion_state()
+
+                else:
+                    raise Exception("You data schema is not valid")
 
         except Exception as e:
-            print(e)
+            logger.exception(e)
+            raise e
 
 
 if __name__ == '__main__':
@@ -1,6 +1,8 @@
 from ml_project.config.configuration import ConfigurationManager
 from ml_project.components.model_trainer import ModelTrainer
+from ml_project.utils.common import artifact_lock
 from ml_project import logger
+import os
 from ml_project.pipeline.stage_01_data_ingestion import STAGE_NAME
 
 STAGE_NAME = "Model Training Stage"
@@ -12,8 +14,11 @@ class ModelTrainerPipeline:
     def main(self):
         config = ConfigurationManager()
         model_trainer_config = config.get_model_trainer_config()
-        model_trainer_config = ModelTrainer(config=model_trainer_config)
-        model_trainer_config.train()
+        # an incremental run consumes the pending training rows of data transformation
+        with artifact_lock(exclusive=[os.path.dirname(model_trainer_config.train_data_path),
+                                      model_trainer_config.root_dir]):
+            model_trainer = ModelTrainer(config=model_trainer_config)
+            model_trainer.train()
         
         
 if __name__ == "__main__":
@@ -1,6 +1,8 @@
 from ml_project.components.model_evaluation import ModelEvaluation
 from ml_project.config.configuration import ConfigurationManager
+from ml_project.utils.common import artifact_lock
 from ml_project import logger
+import os
 
 
 STAGE_NAME = "Model Evaluation stage"
@@ -12,8 +14,11 @@ class ModelEvaluationTrainingPipeline:
     def main(self):
         config = ConfigurationManager()
         model_evaluation_config = config.get_model_evaluation_config()
-        model_evaluation_config = ModelEvaluation(config=model_evaluation_config)
-        model_evaluation_config.log_into_mlflow()
+        with artifact_lock(shared=[os.path.dirname(model_evaluation_config.test_data_path),
+                                   os.path.dirname(model_evaluation_config.model_path)],
+                           exclusive=[model_evaluation_config.root_dir]):
+            model_evaluation = ModelEvaluation(config=model_evaluation_config)
+            model_evaluation.log_into_mlflow()
 
 
 
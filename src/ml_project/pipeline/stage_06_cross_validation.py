@@ -0,0 +1,36 @@
+from ml_project.components.cross_validation import CrossValidation
+from ml_project.config.configuration import ConfigurationManager
+from ml_project.utils.common import artifact_lock
+from ml_project import logger
+import os
+
+
+STAGE_NAME = "Cross Validation Stage"
+
+class CrossValidationTrainingPipeline:
+    def __init__(self):
+        pass
+
+    def main(self):
+        config = ConfigurationManager()
+        cross_validation_config = config.get_cross_validation_config()
+        if not cross_validation_config.enabled:
+            logger.info("Cross-validation is disabled in params.yaml, skipping")
+            return
+        cross_validation = CrossValidation(config=cross_validation_config)
+        with artifact_lock(shared=[os.path.dirname(cross_validation_config.train_data_path)],
+                           exclusive=[cross_validation_config.root_dir,
+                                      os.path.dirname(cross_validation_config.metric_file_name)]):
+            cross_validation.prepare_data()
+            cross_validation.evaluate()
+
+
+if __name__ == '__main__':
+    try:
+        logger.info(">>>>>> %s started <<<<<<", STAGE_NAME)
+        obj = CrossValidationTrainingPipeline()
+        obj.main()
+        logger.info(">>>>>> %s completed <<<<<<\n\nx==========x", STAGE_NAME)
+    except Exception as e:
+        logger.exception(e)
+        raise e
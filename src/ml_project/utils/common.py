@@ -17,9 +17,19 @@ Functions:
   joblib.
 - load_bin(path: Path) -> Any: Loads and returns data from a binary file using joblib.
 - get_size(path: Path) -> str: Returns the size of the file at the specified path in KB.
+- atomic_write(path, mode="w", **kwargs): Context manager yielding a file that replaces
+  `path` in one rename once the block succeeds.
+- artifact_lock(shared=(), exclusive=()): Context manager holding shared and exclusive
+  locks on artifact directories.
 
 Each function is annotated for type checking. Logging is used to track operations.
 
+Every artifact is written with atomic_write (save_json and save_bin use it), so a reader
+sees either the previous or the new version of a file, never a partial one. Stages that
+write several related files, or append to one, additionally hold an exclusive lock on the
+directory, and stages reading it hold a shared lock, so several pipelines can run against
+one artifacts/ tree. Serving only reads single files and takes no locks.
+
 Note:
 - The module uses 'ConfigBox' from the 'box' package for convenient configuration access.
 - It relies on a 'logger' from 'ml_project' for logging.
@@ -28,8 +38,11 @@ Note:
 
 import json
 import os
+import stat
+import tempfile
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 import joblib
 import yaml
 from ensure import ensure_annotations
@@ -38,6 +51,11 @@ from box import ConfigBox
 from box.exceptions import BoxValueError
 from ml_project import logger
 
+try:
+    import fcntl
+except ImportError:  # Windows: locking is skipped, atomic writes still apply
+    fcntl = None
+
 
 @ensure_annotations
 def read_yaml(path_to_yaml: Path) -> ConfigBox:
@@ -87,7 +105,7 @@ def save_json(path: Path, data: dict):
         path (Path): The path to save the JSON file.
         data (dict): The data to be saved in JSON format.
     """
-    with open(path, "w", encoding='utf-8') as f:
+    with atomic_write(path, "w", encoding='utf-8') as f:
         json.dump(data, f, indent=4)
     logger.info("json file saved at: %s", path)
 
@@ -116,7 +134,8 @@ def save_bin(data: Any, path: Path):
         data (Any): The data to be saved.
         path (Path): The path to save the binary file.
     """
-    joblib.dump(value=data, filename=path)
+    with atomic_write(path, "wb") as f:
+        joblib.dump(value=data, filename=f)
     logger.info("binary file saved at: %s", path)
 
 @ensure_annotations
@@ -147,3 +166,55 @@ def get_size(path: Path) -> str:
     """
     size_in_kb = round(os.path.getsize(path) / 1024)
     return f"~ {size_in_kb} KB"
+
+@contextmanager
+def atomic_write(path, mode: str = "w", **kwargs):
+    """
+    Opens a temporary file next to `path` and, when the block exits without error,
+    flushes it to disk and renames it over `path`, which is atomic on POSIX and Windows.
+    On error the temporary file is removed and `path` is left untouched.
+
+    Args:
+        path (Path): The path of the file to write.
+        mode (str, optional): "w" for text or "wb" for binary. Defaults to "w".
+        **kwargs: Passed to `open`, e.g. `encoding` or `newline`.
+
+    Yields:
+        file: The open temporary file.
+    """
+    directory, name = os.path.split(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{name}.", suffix=".tmp")
+    try:
+        with open(fd, mode, **kwargs) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates the file readable by its owner only, keep the usual permissions
+        os.chmod(tmp_path, stat.S_IMODE(os.stat(path).st_mode) if os.path.exists(path) else 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+@contextmanager
+def artifact_lock(shared: Iterable = (), exclusive: Iterable = ()):
+    """
+    Holds file locks on artifact directories for the duration of the block: shared
+    locks on the directories read and exclusive locks on the directories written. The
+    locks are taken in path order so that concurrent pipelines cannot deadlock, and a
+    directory listed in both is locked exclusively.
+
+    Args:
+        shared (iterable, optional): The directories to lock for reading.
+        exclusive (iterable, optional): The directories to lock for writing.
+    """
+    modes = {os.path.abspath(d): False for d in shared}
+    modes.update({os.path.abspath(d): True for d in exclusive})
+    with ExitStack() as stack:
+        if fcntl is not None:
+            for directory in sorted(modes):
+                os.makedirs(directory, exist_ok=True)
+                f = stack.enter_context(open(os.path.join(directory, ".lock"), "a"))
+                fcntl.flock(f, fcntl.LOCK_EX if modes[directory] else fcntl.LOCK_SH)
+        yield
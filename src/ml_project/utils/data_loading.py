@@ -0,0 +1,96 @@
+"""
+This module, data_loading.py, reads the pipeline's CSV files with the column types
+declared in `schema.yaml` instead of letting pandas infer them. Declaring the types up
+front skips the inference pass, and projecting only the columns a caller needs avoids
+parsing the rest. For training, floats can be parsed straight to float32 and integers
+narrowed to the smallest type holding their values, roughly halving the frame's memory.
+
+The pyarrow CSV engine is used when pyarrow is installed (it parses in parallel), and
+the default C engine otherwise or when the file is read in chunks.
+
+Functions:
+- schema_dtypes(schema, columns=None, downcast=False) -> dict: The pandas dtype of each
+  requested column.
+- read_typed_csv(path, schema, columns=None, downcast=False, chunksize=None): Reads a
+  CSV file (or an iterator of chunks) with the schema's types.
+"""
+
+
+from typing import Iterable, Optional
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow  # pylint: disable=unused-import
+    PARSER_ENGINE = "pyarrow"
+except ImportError:
+    PARSER_ENGINE = "c"
+
+
+def schema_dtypes(schema: dict, columns: Optional[Iterable[str]] = None,
+                  downcast: bool = False) -> dict:
+    """
+    Returns the pandas dtype of each requested column as declared in the schema.
+
+    Args:
+        schema (dict): The `COLUMNS` mapping of `schema.yaml`, column name to dtype.
+        columns (iterable, optional): The columns to keep. Defaults to all of them.
+        downcast (bool, optional): If True, floats are read as float32. Integers are
+            parsed at their declared width and narrowed after reading.
+
+    Returns:
+        dict: The dtype of each column, in the requested order.
+    """
+    columns = list(schema.keys()) if columns is None else list(columns)
+    dtypes = {}
+    for col in columns:
+        dtype = np.dtype(schema[col])
+        if downcast and dtype.kind == "f":
+            dtype = np.dtype(np.float32)
+        dtypes[col] = dtype
+    return dtypes
+
+
+def _narrow_integers(data: pd.DataFrame) -> pd.DataFrame:
+    # a new frame rather than assignment, `data` may be a column selection of another
+    narrowed = {col: pd.to_numeric(data[col], downcast="integer")
+                for col in data.columns if data[col].dtype.kind in "iu"}
+    return data.assign(**narrowed) if narrowed else data
+
+
+def read_typed_csv(path, schema: dict, columns: Optional[Iterable[str]] = None,
+                   downcast: bool = False, chunksize: Optional[int] = None):
+    """
+    Reads a CSV file with the column types declared in the schema.
+
+    Args:
+        path (Path): The path to the CSV file.
+        schema (dict): The `COLUMNS` mapping of `schema.yaml`, column name to dtype.
+        columns (iterable, optional): The columns to read, in the order they are
+            returned. Defaults to all the schema's columns.
+        downcast (bool, optional): If True, floats are read as float32 and integers are
+            narrowed to the smallest type that holds their values (int8 for `quality`).
+        chunksize (int, optional): If given, an iterator of frames of this many rows is
+            returned instead of a single frame.
+
+    Raises:
+        ValueError: If a value cannot be parsed as its column's declared type, or a
+            requested column is missing from the file.
+
+    Returns:
+        pd.DataFrame: The data, or an iterator of frames when `chunksize` is given.
+    """
+    dtypes = schema_dtypes(schema, columns, downcast)
+    names = list(dtypes)
+    if chunksize is not None:
+        reader = pd.read_csv(path, usecols=names, dtype=dtypes, chunksize=chunksize)
+        return (_prepare(chunk, names, downcast) for chunk in reader)
+    data = pd.read_csv(path, usecols=names, dtype=dtypes, engine=PARSER_ENGINE)
+    return _prepare(data, names, downcast)
+
+
+def _prepare(data: pd.DataFrame, names: list, downcast: bool) -> pd.DataFrame:
+    # usecols keeps the file's column order, callers get the order they asked for
+    if list(data.columns) != names:
+        data = data[names]
+    return _narrow_integers(data) if downcast else data
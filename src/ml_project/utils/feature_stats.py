@@ -0,0 +1,285 @@
+"""
+This module, feature_stats.py, offers streaming per-feature statistics for the tabular
+data flowing through the pipeline. Statistics are accumulated block by block so a
+dataset never has to be held in memory at once, and partial results can be merged.
+
+Classes:
+- RunningMoments: Per-column count, mean, variance, min and max accumulated over blocks
+  of rows, serialisable to and from a plain dict for storing as JSON.
+- BottomKSample: A bounded uniform sample of rows used to estimate quantiles.
+
+Functions:
+- fold_standardization(model, mean, scale): Folds a standardization step into the
+  coefficients of a fitted linear model so it can score raw features directly.
+- bin_counts(edges, block): Counts the rows of a block falling in each per-feature bin.
+- population_stability_index(expected, actual): PSI between binned distributions.
+- ks_statistic(expected, actual): Binned Kolmogorov-Smirnov statistic.
+"""
+
+
+from typing import Iterable, List
+import numpy as np
+
+
+class RunningMoments:
+    """
+    Streaming per-column moments using the pairwise update of Chan et al., so that
+    every block (or every partial accumulator) is folded in with a single pass.
+
+    Attributes:
+        columns (list): The feature names, in the order the blocks are laid out.
+        count (int): The number of rows seen so far.
+        mean (np.ndarray): The running mean of each column.
+        m2 (np.ndarray): The running sum of squared deviations of each column.
+        min (np.ndarray): The running minimum of each column.
+        max (np.ndarray): The running maximum of each column.
+    """
+
+    def __init__(self, columns: Iterable[str]):
+        """
+        Initializes an empty accumulator for the given columns.
+
+        Parameters:
+            columns (Iterable[str]): The feature names, in block column order.
+        """
+        self.columns: List[str] = list(columns)
+        n_features = len(self.columns)
+        self.count = 0
+        self.mean = np.zeros(n_features)
+        self.m2 = np.zeros(n_features)
+        self.min = np.full(n_features, np.inf)
+        self.max = np.full(n_features, -np.inf)
+
+    def update(self, block) -> "RunningMoments":
+        """
+        Folds a block of rows into the running statistics.
+
+        Parameters:
+            block (array-like): A 2D block of shape (n_rows, n_features).
+
+        Returns:
+            RunningMoments: The accumulator itself, to allow chaining.
+        """
+        block = np.asarray(block, dtype=np.float64)
+        if block.shape[0] == 0:
+            return self
+        other = RunningMoments(self.columns)
+        other.count = block.shape[0]
+        other.mean = block.mean(axis=0)
+        other.m2 = ((block - other.mean) ** 2).sum(axis=0)
+        other.min = block.min(axis=0)
+        other.max = block.max(axis=0)
+        return self.merge(other)
+
+    def merge(self, other: "RunningMoments") -> "RunningMoments":
+        """
+        Merges another accumulator over the same columns into this one.
+
+        Parameters:
+            other (RunningMoments): The accumulator to merge in.
+
+        Returns:
+            RunningMoments: The accumulator itself, to allow chaining.
+        """
+        if other.columns != self.columns:
+            raise ValueError("Cannot merge statistics over different columns")
+        total = self.count + other.count
+        if other.count == 0:
+            return self
+        delta = other.mean - self.mean
+        self.mean = self.mean + delta * (other.count / total)
+        self.m2 = self.m2 + other.m2 + delta ** 2 * (self.count * other.count / total)
+        self.min = np.minimum(self.min, other.min)
+        self.max = np.maximum(self.max, other.max)
+        self.count = total
+        return self
+
+    @property
+    def var(self) -> np.ndarray:
+        """The population variance of each column."""
+        if self.count == 0:
+            return np.zeros_like(self.m2)
+        return self.m2 / self.count
+
+    @property
+    def std(self) -> np.ndarray:
+        """The population standard deviation of each column."""
+        return np.sqrt(self.var)
+
+    @property
+    def scale(self) -> np.ndarray:
+        """The standard deviation of each column, with constant columns mapped to 1."""
+        std = self.std
+        return np.where(std > 0, std, 1.0)
+
+    def to_dict(self) -> dict:
+        """
+        Serialises the statistics to a JSON friendly dict keyed by column name.
+
+        Returns:
+            dict: The row count and the per-column statistics.
+        """
+        return {
+            "count": int(self.count),
+            "columns": {
+                col: {
+                    "mean": float(self.mean[i]),
+                    "var": float(self.var[i]),
+                    "min": float(self.min[i]),
+                    "max": float(self.max[i]),
+                }
+                for i, col in enumerate(self.columns)
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, content: dict) -> "RunningMoments":
+        """
+        Rebuilds an accumulator from the output of `to_dict`.
+
+        Parameters:
+            content (dict): The serialised statistics.
+
+        Returns:
+            RunningMoments: The restored accumulator.
+        """
+        columns = content["columns"]
+        stats = cls(columns.keys())
+        stats.count = int(content["count"])
+        stats.mean = np.array([columns[col]["mean"] for col in stats.columns])
+        stats.m2 = np.array([columns[col]["var"] for col in stats.columns]) * stats.count
+        stats.min = np.array([columns[col]["min"] for col in stats.columns])
+        stats.max = np.array([columns[col]["max"] for col in stats.columns])
+        return stats
+
+
+def fold_standardization(model, mean, scale):
+    """
+    Folds a standardization step `(x - mean) / scale` into a fitted linear model, so
+    the model scores raw features with the same single dot product.
+
+    Args:
+        model: A fitted linear model exposing `coef_` and `intercept_`.
+        mean (array-like): The per-feature mean used for centering.
+        scale (array-like): The per-feature scale used for scaling.
+
+    Returns:
+        The same model, with `coef_` and `intercept_` expressed in raw feature units.
+    """
+    mean = np.asarray(mean, dtype=np.float64)
+    scale = np.asarray(scale, dtype=np.float64)
+    coef = np.asarray(model.coef_) / scale
+    model.intercept_ = model.intercept_ - (coef * mean).sum(axis=-1)
+    model.coef_ = coef
+    return model
+
+
+class BottomKSample:
+    """
+    A bounded uniform sample of rows kept with bottom-k sampling: each row gets a random
+    key and only the `k` rows with the smallest keys are retained. Blocks are folded in
+    vectorised, and the sample is used to estimate quantiles in the same streaming pass.
+
+    Attributes:
+        k (int): The maximum number of rows retained.
+        rows (np.ndarray): The retained rows, of shape (<= k, n_features).
+        keys (np.ndarray): The random keys of the retained rows.
+    """
+
+    def __init__(self, k: int, n_features: int, seed: int = 42):
+        """
+        Initializes an empty sample.
+
+        Parameters:
+            k (int): The maximum number of rows retained.
+            n_features (int): The number of columns of each row.
+            seed (int, optional): Seed of the key generator. Defaults to 42.
+        """
+        self.k = k
+        self.rows = np.empty((0, n_features))
+        self.keys = np.empty(0)
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, block) -> "BottomKSample":
+        """
+        Folds a block of rows into the sample.
+
+        Parameters:
+            block (array-like): A 2D block of shape (n_rows, n_features).
+
+        Returns:
+            BottomKSample: The sample itself, to allow chaining.
+        """
+        block = np.asarray(block, dtype=np.float64)
+        rows = np.concatenate([self.rows, block])
+        keys = np.concatenate([self.keys, self._rng.random(block.shape[0])])
+        if keys.shape[0] > self.k:
+            keep = np.argpartition(keys, self.k - 1)[:self.k]
+            rows, keys = rows[keep], keys[keep]
+        self.rows, self.keys = rows, keys
+        return self
+
+    def quantiles(self, q) -> np.ndarray:
+        """
+        Estimates per-column quantiles from the sample.
+
+        Parameters:
+            q (array-like): The quantile levels, in [0, 1].
+
+        Returns:
+            np.ndarray: The quantiles, of shape (len(q), n_features).
+        """
+        return np.quantile(self.rows, q, axis=0)
+
+
+def bin_counts(edges: np.ndarray, block) -> np.ndarray:
+    """
+    Counts, per feature, how many rows of a block fall in each bin. Bin `j` of feature
+    `i` holds values `x` with `edges[i, j - 1] <= x < edges[i, j]`, the outer bins being
+    open-ended, so the result has `edges.shape[1] + 1` bins per feature.
+
+    Args:
+        edges (np.ndarray): The inner bin edges, of shape (n_features, n_bins - 1).
+        block (array-like): A 2D block of shape (n_rows, n_features).
+
+    Returns:
+        np.ndarray: The counts, of shape (n_features, n_bins).
+    """
+    n_features, n_bins = edges.shape[0], edges.shape[1] + 1
+    block = np.asarray(block, dtype=np.float64).reshape(-1, n_features)
+    index = (block[:, :, None] >= edges[None, :, :]).sum(axis=-1)
+    index += np.arange(n_features) * n_bins
+    return np.bincount(index.ravel(), minlength=n_features * n_bins).reshape(n_features, n_bins)
+
+
+def population_stability_index(expected, actual, eps: float = 1e-4) -> np.ndarray:
+    """
+    Computes the Population Stability Index between binned distributions.
+
+    Args:
+        expected (array-like): Reference bin fractions, of shape (n_features, n_bins).
+        actual (array-like): Observed bin fractions, of the same shape.
+        eps (float, optional): Floor applied to fractions to keep the log finite.
+
+    Returns:
+        np.ndarray: The PSI of each feature.
+    """
+    expected = np.clip(np.asarray(expected, dtype=np.float64), eps, None)
+    actual = np.clip(np.asarray(actual, dtype=np.float64), eps, None)
+    return ((actual - expected) * np.log(actual / expected)).sum(axis=-1)
+
+
+def ks_statistic(expected, actual) -> np.ndarray:
+    """
+    Computes a binned Kolmogorov-Smirnov statistic, the largest absolute difference
+    between the cumulative bin fractions.
+
+    Args:
+        expected (array-like): Reference bin fractions, of shape (n_features, n_bins).
+        actual (array-like): Observed bin fractions, of the same shape.
+
+    Returns:
+        np.ndarray: The KS statistic of each feature.
+    """
+    diff = np.cumsum(actual, axis=-1) - np.cumsum(expected, axis=-1)
+    return np.abs(diff).max(axis=-1)
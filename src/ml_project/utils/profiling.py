@@ -0,0 +1,168 @@
+"""
+This module, profiling.py, profiles a block of code on demand: a pipeline stage or a
+single prediction request. While active, `Profiler` runs `cProfile` on the calling
+thread, samples that thread's stack at a fixed interval and traces allocations with
+`tracemalloc`, then writes its reports under the profiling `root_dir`:
+
+- `<name>.prof`: the cProfile statistics, for `pstats`, snakeviz or gprof2dot.
+- `<name>.txt`: the top functions by cumulative and by own time.
+- `<name>.collapsed`: the sampled stacks in collapsed format ("a;b;c count"), the input
+  of flamegraph.pl, inferno or speedscope.
+- `<name>.allocations.txt`: the peak traced memory above its level on entry and the
+  source lines that allocated the most memory while profiling.
+
+Only one profile runs at a time in a process. A `Profiler` entered while another is
+active does nothing. Work done in worker processes (e.g. the cross-validation or shard
+pools) is not profiled.
+
+Classes:
+- Profiler: A context manager that profiles the block it wraps.
+
+Functions:
+- profiling_enabled() -> bool: Whether the `ML_PROJECT_PROFILE` switch is set.
+"""
+
+
+import cProfile
+import io
+import os
+import pstats
+import re
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+from ml_project import logger
+from ml_project.entity.config_entity import ProfilingConfig
+
+PROFILE_ENV_VAR = "ML_PROJECT_PROFILE"
+
+_active = threading.Lock()
+
+
+def profiling_enabled() -> bool:
+    """
+    Returns True when the `ML_PROJECT_PROFILE` environment variable is set to a true
+    value ("1", "true", "yes" or "on").
+    """
+    return os.environ.get(PROFILE_ENV_VAR, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+class Profiler:
+    """
+    Profiles the block it wraps and saves the reports when the block exits.
+
+    Attributes:
+        config (ProfilingConfig): Configuration object containing settings for profiling.
+        name (str): The file name stem of the reports, from the label, time and process id.
+        active (bool): Whether this profiler is recording, False if another one was.
+    """
+
+    def __init__(self, label: str, config: ProfilingConfig):
+        """
+        Initializes the Profiler.
+
+        Parameters:
+            label (str): What is profiled, e.g. a stage name. Used in the report names.
+            config (ProfilingConfig): The configuration for profiling.
+        """
+        self.config = config
+        slug = re.sub(r"[^a-z0-9]+", "-", label.lower()).strip("-")
+        now = time.time()
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(now)) + f"{now % 1:.3f}"[1:]
+        self.name = f"{slug}-{stamp}-{os.getpid()}"
+        self.active = False
+        self._profile = None
+        self._samples = Counter()
+        self._stop = threading.Event()
+        self._sampler = None
+        self._started_tracemalloc = False
+        self._snapshot = None
+        self._start_memory = 0
+
+    def __enter__(self) -> "Profiler":
+        if not _active.acquire(blocking=False):
+            logger.warning("Another profile is running, not profiling %s", self.name)
+            return self
+        try:
+            self._started_tracemalloc = not tracemalloc.is_tracing()
+            if self._started_tracemalloc:
+                tracemalloc.start()
+            elif hasattr(tracemalloc, "reset_peak"):
+                # Python >= 3.9; on 3.8 an earlier peak can only be reported as is
+                tracemalloc.reset_peak()
+            self._start_memory, _ = tracemalloc.get_traced_memory()
+            self._snapshot = tracemalloc.take_snapshot()
+
+            self._sampler = threading.Thread(target=self._sample, args=(threading.get_ident(),),
+                                             name="profile-sampler", daemon=True)
+            self._sampler.start()
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        except BaseException:
+            # undo the partial setup so later profiles are not skipped for good
+            self._stop.set()
+            if self._sampler is not None and self._sampler.is_alive():
+                self._sampler.join()
+            if self._started_tracemalloc and tracemalloc.is_tracing():
+                tracemalloc.stop()
+            _active.release()
+            raise
+        self.active = True
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        if not self.active:
+            return False
+        try:
+            self._profile.disable()
+            self._stop.set()
+            self._sampler.join()
+            _, peak = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot()
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+            self._save(snapshot, max(peak - self._start_memory, 0))
+        finally:
+            _active.release()
+        return False
+
+    def _sample(self, thread_id: int):
+        interval = self.config.sample_interval
+        while not self._stop.wait(interval):
+            frame = sys._current_frames().get(thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}"
+                             f":{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                self._samples[";".join(reversed(stack))] += 1
+
+    def _save(self, snapshot, peak: int):
+        root = Path(self.config.root_dir)
+        os.makedirs(root, exist_ok=True)
+        self._profile.dump_stats(root / f"{self.name}.prof")
+
+        summary = io.StringIO()
+        stats = pstats.Stats(self._profile, stream=summary).strip_dirs()
+        stats.sort_stats("cumulative").print_stats(self.config.top_n)
+        stats.sort_stats("tottime").print_stats(self.config.top_n)
+        (root / f"{self.name}.txt").write_text(summary.getvalue(), encoding="utf-8")
+
+        collapsed = "".join(f"{stack} {count}\n" for stack, count in self._samples.items())
+        (root / f"{self.name}.collapsed").write_text(collapsed, encoding="utf-8")
+
+        ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]
+        diff = snapshot.filter_traces(ignore).compare_to(
+            self._snapshot.filter_traces(ignore), "lineno")
+        lines = [f"peak traced memory above start: {peak / 2**20:.1f} MiB",
+                 f"top {self.config.top_n} allocating lines (net change while profiling):"]
+        lines += [str(stat) for stat in diff[:self.config.top_n]]
+        (root / f"{self.name}.allocations.txt").write_text("\n".join(lines) + "\n",
+                                                           encoding="utf-8")
+        logger.info("Saved profile %s to %s (%s stack samples, peak %.1f MiB)",
+                    self.name, root, sum(self._samples.values()), peak / 2**20)
@@ -0,0 +1,129 @@
+"""
+This module, row_hashing.py, identifies duplicate rows of the dataset while streaming
+it in chunks. Each row is reduced to a 64-bit hash of its canonicalized feature values,
+and the hashes seen so far are kept in a sorted uint64 array (8 bytes per distinct
+row), so duplicates are found without holding the data itself in memory. The same hash
+decides the split side of a row, which puts every group of duplicates on one side.
+
+Classes:
+- HashSet: A compact, mergeable set of 64-bit row hashes that can be saved to disk.
+
+Functions:
+- row_hashes(frame, columns) -> np.ndarray: The 64-bit hash of each row's values.
+- in_test_split(hashes, test_size) -> np.ndarray: Whether each row belongs to the test
+  split, derived from its hash.
+"""
+
+
+from pathlib import Path
+import numpy as np
+import pandas as pd
+from ml_project import logger
+from ml_project.utils.common import atomic_write
+
+
+def row_hashes(frame: pd.DataFrame, columns) -> np.ndarray:
+    """
+    Hashes the values of the given columns of each row. Values are compared as float64,
+    with -0.0 folded into 0.0 and every NaN treated alike, so rows that are equal as
+    numbers get the same hash whatever their text representation.
+
+    Args:
+        frame (pd.DataFrame): The rows to hash.
+        columns (list): The columns forming the key of a row.
+
+    Returns:
+        np.ndarray: The uint64 hash of each row.
+    """
+    values = frame[list(columns)].to_numpy(dtype=np.float64) + 0.0
+    values[np.isnan(values)] = np.nan
+    return pd.util.hash_pandas_object(pd.DataFrame(values), index=False).to_numpy()
+
+
+def in_test_split(hashes: np.ndarray, test_size: float) -> np.ndarray:
+    """
+    Assigns rows to the test split when their hash falls in the `test_size` fraction.
+    The assignment only depends on the row's values, so duplicates always land on the
+    same side and a row keeps its side across runs.
+
+    Args:
+        hashes (np.ndarray): The uint64 hash of each row.
+        test_size (float): The expected fraction of rows in the test split.
+
+    Returns:
+        np.ndarray: A boolean mask of the rows belonging to the test split.
+    """
+    return (hashes % 10_000) < test_size * 10_000
+
+
+class HashSet:
+    """
+    A set of 64-bit row hashes stored as one sorted uint64 array.
+
+    Memory is not bounded: the set takes 8 bytes per distinct row ever added, e.g. 80 MB
+    for 10 million rows, and `add` briefly holds the old and the merged array, doubling
+    that at peak. A warning is logged once the set grows past `warn_size` hashes, the
+    point where feeds should be deduplicated upstream or split by time.
+
+    Attributes:
+        hashes (np.ndarray): The distinct hashes seen so far, sorted.
+        warn_size (int): The number of hashes above which a warning is logged.
+    """
+
+    warn_size = 100_000_000
+
+    def __init__(self, hashes=None):
+        """
+        Initializes the set.
+
+        Parameters:
+            hashes (np.ndarray, optional): Sorted distinct hashes to start from.
+        """
+        self.hashes = np.empty(0, dtype=np.uint64) if hashes is None else hashes
+        self._warned = False
+
+    def __len__(self) -> int:
+        return len(self.hashes)
+
+    def add(self, hashes: np.ndarray) -> np.ndarray:
+        """
+        Adds a block of hashes.
+
+        Parameters:
+            hashes (np.ndarray): The uint64 hashes of a block of rows, in row order.
+
+        Returns:
+            np.ndarray: A boolean mask of the rows whose hash had not been seen before,
+            counting earlier rows of the same block.
+        """
+        distinct, first = np.unique(hashes, return_index=True)
+        position = np.searchsorted(self.hashes, distinct)
+        seen = position < len(self.hashes)
+        seen[seen] = self.hashes[position[seen]] == distinct[seen]
+
+        is_new = np.zeros(len(hashes), dtype=bool)
+        is_new[first[~seen]] = True
+        if not seen.all():
+            # the new hashes are sorted and their insertion points already known, so
+            # inserting them is one linear merge instead of an O(n log n) re-sort
+            self.hashes = np.insert(self.hashes, position[~seen], distinct[~seen])
+            if len(self.hashes) > self.warn_size and not self._warned:
+                logger.warning("Row hash set holds %s distinct rows (%.0f MiB) and keeps "
+                               "growing with every new row", len(self.hashes),
+                               self.hashes.nbytes / 2**20)
+                self._warned = True
+        return is_new
+
+    def save(self, path: Path):
+        """
+        Saves the hashes as a `.npy` file.
+        """
+        with atomic_write(path, "wb") as f:
+            np.save(f, self.hashes)
+
+    @classmethod
+    def load(cls, path: Path) -> "HashSet":
+        """
+        Loads hashes saved by `save`.
+        """
+        return cls(np.load(path))
@@ -0,0 +1,53 @@
+"""
+This module, sharding.py, supports datasets ingested as several shard files. The data
+ingestion stage lists the shards in a JSON file, and the later stages process every
+shard in a pool of worker processes before merging the per-shard results.
+
+Functions:
+- load_shards(shards_file) -> list: The shard paths of a sharded run, or None.
+- map_shards(func, shards, n_jobs, *args) -> list: Applies a function to every shard in
+  a process pool and returns the results in shard order.
+"""
+
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, List, Optional
+from ml_project.utils.common import load_json
+
+
+def load_shards(shards_file: Path) -> Optional[List[str]]:
+    """
+    Returns the shard paths saved by the data ingestion stage.
+
+    Args:
+        shards_file (Path): The shard list written by `DataIngestion.ingest_shards`.
+
+    Returns:
+        list: The shard paths, or None when the last ingestion was not sharded.
+    """
+    if not os.path.exists(shards_file):
+        return None
+    return list(load_json(Path(shards_file)).shards)
+
+
+def map_shards(func: Callable, shards: list, n_jobs: int, *args) -> list:
+    """
+    Calls `func(index, shard, *args)` for every shard in a pool of worker processes.
+    `func` must be defined at module level so the workers can import it.
+
+    Args:
+        func (Callable): The function to apply.
+        shards (list): The shard paths.
+        n_jobs (int): The number of worker processes, 0 for one per core. Never more
+            than the number of shards.
+        *args: Extra arguments passed to every call.
+
+    Returns:
+        list: The results, in shard order.
+    """
+    n_jobs = min(n_jobs or os.cpu_count(), len(shards))
+    with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        futures = [executor.submit(func, i, shard, *args) for i, shard in enumerate(shards)]
+        return [future.result() for future in futures]
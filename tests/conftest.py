@@ -0,0 +1,40 @@
+"""
+Shared fixtures of the test suite: the project's schema and small synthetic wine-quality
+datasets with the schema's columns.
+"""
+
+
+from pathlib import Path
+import numpy as np
+import pandas as pd
+import pytest
+from ml_project.utils.common import read_yaml
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture(scope="session")
+def schema():
+    """The `schema.yaml` of the project."""
+    return read_yaml(ROOT_DIR / "schema.yaml")
+
+
+@pytest.fixture
+def make_wine_frame(schema):
+    """
+    Returns a function building a frame of `n_rows` random rows with the schema's
+    columns, plus `n_duplicates` copies of earlier rows' features with another target.
+    """
+    def make(n_rows: int = 500, n_duplicates: int = 0, seed: int = 0) -> pd.DataFrame:
+        rng = np.random.default_rng(seed)
+        target = schema.TARGET_COLUMN.name
+        features = [col for col in schema.COLUMNS if col != target]
+        data = pd.DataFrame(rng.lognormal(0.0, 1.0, (n_rows, len(features))), columns=features)
+        data[target] = rng.integers(3, 9, n_rows)
+        if n_duplicates:
+            copies = data.sample(n_duplicates, replace=True, random_state=seed).copy()
+            copies[target] = rng.integers(3, 9, n_duplicates)
+            data = pd.concat([data, copies], ignore_index=True)
+            data = data.sample(frac=1.0, random_state=seed).reset_index(drop=True)
+        return data[list(schema.COLUMNS)]
+    return make
@@ -0,0 +1,187 @@
+import importlib
+import os
+import shutil
+import sys
+from pathlib import Path
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import ElasticNet
+from ml_project.utils.common import save_json
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture(scope="module")
+def app_module(tmp_path_factory):
+    """
+    Imports app.py from a scratch working directory holding the project's configuration
+    and a small trained model, so the tests never touch the real artifacts.
+    """
+    workdir = tmp_path_factory.mktemp("serving")
+    shutil.copytree(ROOT_DIR / "config", workdir / "config")
+    for name in ("params.yaml", "schema.yaml"):
+        shutil.copy(ROOT_DIR / name, workdir / name)
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.chdir(workdir)
+        mp.syspath_prepend(str(ROOT_DIR))
+        module = importlib.import_module("app")
+        columns = module.FEATURE_COLUMNS
+        rng = np.random.default_rng(0)
+        x = pd.DataFrame(rng.normal(5.0, 1.0, (200, len(columns))), columns=columns)
+        model = ElasticNet(alpha=0.01).fit(x, x.to_numpy() @ np.arange(len(columns)) + 1.0)
+        os.makedirs("artifacts/model_trainer", exist_ok=True)
+        joblib.dump(model, "artifacts/model_trainer/model.joblib")
+        yield module
+        for service in (module.drift_monitor, module.prediction_log, module.shadow_recorder):
+            service.stop()
+        sys.modules.pop("app", None)
+
+
+@pytest.fixture
+def client(app_module):
+    return app_module.app.test_client()
+
+
+@pytest.fixture
+def rows(app_module):
+    rng = np.random.default_rng(1)
+    return rng.normal(5.0, 1.0, (3, len(app_module.FEATURE_COLUMNS)))
+
+
+def _read(app_module, body, query_string=None, headers=None):
+    with app_module.app.test_request_context("/predict/raw", method="POST", data=body,
+                                             query_string=query_string, headers=headers):
+        return app_module.read_raw_rows()
+
+
+def test_read_raw_rows_decodes_packed_rows(app_module, rows):
+    data, error = _read(app_module, rows.astype("<f8").tobytes(), headers={"X-Rows": "3"})
+    assert error is None
+    assert data.dtype == np.float64
+    np.testing.assert_array_equal(data, rows)
+
+    data, error = _read(app_module, rows.astype("<f4").tobytes(), {"dtype": "float32"})
+    assert error is None
+    assert data.dtype == np.float32
+    np.testing.assert_array_equal(data, rows.astype(np.float32))
+
+
+@pytest.mark.parametrize("body,query_string,headers,message", [
+    (b"", None, None, "body must be a non-empty multiple of 88 bytes"),
+    (b"\0" * 100, None, None, "body must be a non-empty multiple of 88 bytes"),
+    (b"\0" * 88, {"dtype": "int8"}, None, "dtype must be one of: float64, float32"),
+    (b"\0" * 176, None, {"X-Rows": "3"}, "X-Rows does not match the 2 rows in the body"),
+    (b"\0" * 176, None, {"X-Rows": "two"}, "X-Rows does not match the 2 rows in the body"),
+])
+def test_read_raw_rows_rejects_malformed_bodies(app_module, body, query_string, headers,
+                                                message):
+    data, error = _read(app_module, body, query_string, headers)
+    assert data is None
+    assert error == (message, 400)
+
+
+def test_predict_raw_scores_every_row(client, rows):
+    response = client.post("/predict/raw", data=rows.tobytes())
+    assert response.status_code == 200
+    assert response.headers["X-Rows"] == "3"
+    expected = rows @ np.arange(rows.shape[1]) + 1.0
+    np.testing.assert_allclose(np.frombuffer(response.data), expected, rtol=1e-2)
+
+
+def test_predict_raw_rejects_non_finite_rows(client, rows):
+    rows[1, 0], rows[2, 4] = np.nan, -np.inf
+    response = client.post("/predict/raw", data=rows.tobytes())
+    assert response.status_code == 400
+    assert b"rows [1, 2]" in response.data
+
+
+@pytest.mark.parametrize("body", [[1, 2], "rows", 3, None])
+def test_explain_rejects_json_bodies_that_are_not_objects(client, body):
+    response = client.post("/explain", json=body)
+    assert response.status_code == 400
+    assert response.data == b"body must be a JSON object or packed rows"
+
+
+def test_explain_rejects_a_missing_body(client):
+    assert client.post("/explain", data="not json", content_type="text/plain").status_code == 400
+
+
+@pytest.mark.parametrize("payload", [
+    {},
+    {"rows": list(range(22))},
+    {"rows": []},
+    {"rows": [list(range(10))]},
+    {"rows": [list(range(11)), list(range(10))]},
+    {"rows": [["a"] * 11]},
+])
+def test_explain_rejects_rows_of_the_wrong_shape(client, payload):
+    response = client.post("/explain", json=payload)
+    assert response.status_code == 400
+    assert response.data.startswith(b'JSON body must hold "rows"')
+
+
+def test_explain_rejects_non_finite_rows(client, rows):
+    rows[0, 3] = np.inf
+    response = client.post("/explain", data=rows.tobytes(),
+                           content_type="application/octet-stream")
+    assert response.status_code == 400
+    assert b"rows [0]" in response.data
+
+    # NaN and Infinity are accepted by Flask's JSON parser
+    response = client.post("/explain", data='{"rows": [[NaN, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10]]}',
+                           content_type="application/json")
+    assert response.status_code == 400
+    assert b"rows [0]" in response.data
+
+
+@pytest.fixture
+def feature_stats(app_module):
+    path = app_module.explainer_config.baseline_stats_file
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    columns = {col: {"mean": 5.0} for col in app_module.FEATURE_COLUMNS}
+    save_json(path=Path(path), data={"columns": columns})
+    yield path
+    os.remove(path)
+
+
+def test_explain_without_feature_statistics_is_unavailable(client, rows):
+    response = client.post("/explain", json={"rows": rows.tolist()})
+    assert response.status_code == 503
+
+
+def test_explain_contributions_add_up_to_the_prediction(client, rows, feature_stats):
+    response = client.post("/explain?top_k=0", json={"rows": rows.tolist()})
+    assert response.status_code == 200
+    result = response.get_json()
+    contributions = np.array(result["contributions"])
+    assert contributions.shape == rows.shape
+    np.testing.assert_allclose(result["baseline"] + contributions.sum(axis=1),
+                               result["predictions"])
+    served = np.frombuffer(client.post("/predict/raw", data=rows.tobytes()).data)
+    np.testing.assert_allclose(result["predictions"], served)
+
+
+@pytest.mark.parametrize("query,payload_top_k,expected", [
+    ("", None, 3), ("?top_k=2", None, 2), ("?top_k=2", 4, 4), ("", 99, 11), ("", -5, None),
+])
+def test_explain_top_k_is_clamped(client, rows, feature_stats, query, payload_top_k, expected):
+    payload = {"rows": rows.tolist()}
+    if payload_top_k is not None:
+        payload["top_k"] = payload_top_k
+    result = client.post("/explain" + query, json=payload).get_json()
+    if expected is None:
+        assert "top_features" not in result and len(result["contributions"][0]) == 11
+    else:
+        assert len(result["top_features"][0]) == expected
+
+
+@pytest.mark.parametrize("query,payload", [
+    ("?top_k=abc", {}), ("", {"top_k": "abc"}), ("", {"top_k": None}), ("", {"top_k": [1]}),
+])
+def test_explain_rejects_a_non_integer_top_k(client, rows, query, payload):
+    response = client.post("/explain" + query, json={"rows": rows.tolist(), **payload})
+    assert response.status_code == 400
+    assert response.data == b"top_k must be an integer"
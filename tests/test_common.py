@@ -0,0 +1,93 @@
+import os
+import stat
+import threading
+import pytest
+from ml_project.utils import common
+from ml_project.utils.common import artifact_lock, atomic_write
+
+needs_flock = pytest.mark.skipif(common.fcntl is None, reason="file locks need fcntl")
+
+
+def test_atomic_write_replaces_the_file(tmp_path):
+    path = tmp_path / "model.bin"
+    path.write_bytes(b"old")
+    os.chmod(path, 0o640)
+    with open(path, "rb") as reader:
+        with atomic_write(path, "wb") as f:
+            f.write(b"new")
+            assert path.read_bytes() == b"old"
+        # a reader that opened the file before keeps the complete old version
+        assert reader.read() == b"old"
+    assert path.read_bytes() == b"new"
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o640
+    assert os.listdir(tmp_path) == ["model.bin"]
+
+
+def test_atomic_write_creates_a_readable_file(tmp_path):
+    path = tmp_path / "status.json"
+    with atomic_write(path, encoding="utf-8") as f:
+        f.write("{}")
+    assert path.read_text(encoding="utf-8") == "{}"
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o644
+
+
+def test_atomic_write_leaves_the_file_untouched_on_error(tmp_path):
+    path = tmp_path / "train.csv"
+    path.write_text("a\n1\n")
+    with pytest.raises(RuntimeError):
+        with atomic_write(path) as f:
+            f.write("a\n")
+            raise RuntimeError("interrupted")
+    assert path.read_text() == "a\n1\n"
+    assert os.listdir(tmp_path) == ["train.csv"]
+
+
+def _try_lock(results, key, **dirs):
+    with artifact_lock(**dirs):
+        results[key] = True
+
+
+def _blocked(directory, **dirs) -> bool:
+    """Whether taking `dirs` blocks while `directory` is locked exclusively."""
+    results = {}
+    with artifact_lock(exclusive=[directory]):
+        thread = threading.Thread(target=_try_lock, args=(results, "taken"), kwargs=dirs)
+        thread.start()
+        thread.join(0.2)
+        blocked = "taken" not in results
+    thread.join(5)
+    assert results == {"taken": True}
+    return blocked
+
+
+@needs_flock
+def test_artifact_lock_excludes_readers_and_writers(tmp_path):
+    assert _blocked(tmp_path, shared=[tmp_path])
+    assert _blocked(tmp_path, exclusive=[tmp_path])
+    assert not _blocked(tmp_path, exclusive=[tmp_path / "other"])
+
+
+@needs_flock
+def test_artifact_lock_allows_concurrent_readers(tmp_path):
+    results = {}
+    with artifact_lock(shared=[tmp_path]):
+        thread = threading.Thread(target=_try_lock, args=(results, "taken"),
+                                  kwargs={"shared": [tmp_path]})
+        thread.start()
+        thread.join(5)
+        assert results == {"taken": True}
+
+
+@needs_flock
+def test_artifact_lock_takes_a_directory_in_both_lists_exclusively(tmp_path):
+    directory = tmp_path / "new" / "dir"
+    results = {}
+    with artifact_lock(shared=[directory], exclusive=[directory]):
+        assert os.path.exists(directory / ".lock")
+        thread = threading.Thread(target=_try_lock, args=(results, "taken"),
+                                  kwargs={"shared": [directory]})
+        thread.start()
+        thread.join(0.2)
+        assert results == {}
+    thread.join(5)
+    assert results == {"taken": True}
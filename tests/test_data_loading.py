@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+import pytest
+from ml_project.utils.data_loading import read_typed_csv, schema_dtypes
+
+
+@pytest.fixture
+def csv_path(tmp_path, make_wine_frame):
+    path = tmp_path / "data.csv"
+    make_wine_frame(n_rows=200).to_csv(path, index=False)
+    return path
+
+
+def test_schema_dtypes_downcast_floats_only(schema):
+    dtypes = schema_dtypes(schema.COLUMNS, ["alcohol", "quality"], downcast=True)
+    assert dtypes == {"alcohol": np.dtype(np.float32), "quality": np.dtype(np.int64)}
+
+
+def test_read_typed_csv_uses_the_schema_types(csv_path, schema):
+    data = read_typed_csv(csv_path, schema.COLUMNS)
+    assert list(data.columns) == list(schema.COLUMNS)
+    assert {str(dtype) for dtype in data.dtypes} == {"float64", "int64"}
+
+
+def test_read_typed_csv_projects_and_narrows(csv_path, schema):
+    full = read_typed_csv(csv_path, schema.COLUMNS)
+    data = read_typed_csv(csv_path, schema.COLUMNS, columns=["quality", "pH"], downcast=True)
+    assert list(data.columns) == ["quality", "pH"]
+    assert data["quality"].dtype == np.int8 and data["pH"].dtype == np.float32
+    np.testing.assert_array_equal(data["quality"], full["quality"])
+    np.testing.assert_allclose(data["pH"], full["pH"], rtol=1e-6)
+
+
+def test_read_typed_csv_in_chunks(csv_path, schema):
+    chunks = list(read_typed_csv(csv_path, schema.COLUMNS, downcast=True, chunksize=64))
+    assert [len(chunk) for chunk in chunks] == [64, 64, 64, 8]
+    assert all(chunk["quality"].dtype == np.int8 for chunk in chunks)
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True),
+                                  read_typed_csv(csv_path, schema.COLUMNS, downcast=True))
+
+
+def test_read_typed_csv_rejects_values_of_the_wrong_type(tmp_path, schema):
+    path = tmp_path / "bad.csv"
+    path.write_text("pH,quality\n3.1,5\n3.2,five\n")
+    with pytest.raises(ValueError):
+        read_typed_csv(path, schema.COLUMNS, columns=["pH", "quality"])
@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+from sklearn.linear_model import ElasticNet
+from ml_project.utils.gram_stats import GramStatistics
+
+
+@pytest.fixture
+def regression():
+    rng = np.random.default_rng(0)
+    x = rng.normal([8.0, 0.5, 50.0, 1.0], [2.0, 0.1, 30.0, 0.001], (400, 4))
+    y = x @ np.array([0.3, -2.0, 0.01, 50.0]) + rng.normal(0.0, 0.5, 400)
+    return x, y
+
+
+def _sklearn_fit(x, y, alpha, l1_ratio):
+    model = ElasticNet(alpha=alpha, l1_ratio=l1_ratio, tol=1e-12, max_iter=100_000)
+    return model.fit(x, y)
+
+
+@pytest.mark.parametrize("alpha,l1_ratio", [(0.1, 0.5), (0.01, 0.9), (1.0, 0.1)])
+def test_solution_matches_sklearn_elastic_net(regression, alpha, l1_ratio):
+    x, y = regression
+    coef, intercept, _ = GramStatistics(x.shape[1]).update(x, y).solve_elastic_net(
+        alpha, l1_ratio, tol=1e-12, max_iter=100_000)
+    expected = _sklearn_fit(x, y, alpha, l1_ratio)
+    np.testing.assert_allclose(coef, expected.coef_, rtol=1e-6, atol=1e-8)
+    assert intercept == pytest.approx(expected.intercept_, rel=1e-6)
+
+
+def test_standardized_solution_matches_sklearn_on_scaled_features(regression):
+    x, y = regression
+    stats = GramStatistics(x.shape[1]).update(x, y)
+    coef, intercept, _ = stats.solve_elastic_net(0.1, 0.5, standardize=True, tol=1e-12,
+                                                 max_iter=100_000)
+    mean, scale = x.mean(axis=0), x.std(axis=0)
+    expected = _sklearn_fit((x - mean) / scale, y, 0.1, 0.5)
+    np.testing.assert_allclose(coef, expected.coef_ / scale, rtol=1e-6, atol=1e-8)
+    assert intercept == pytest.approx(expected.intercept_ - (mean * expected.coef_ / scale).sum(),
+                                      rel=1e-6)
+
+
+def test_block_updates_match_a_single_update(regression):
+    x, y = regression
+    whole = GramStatistics(x.shape[1]).update(x, y)
+    blocks = GramStatistics(x.shape[1])
+    for start in range(0, len(y), 70):
+        blocks.update(x[start:start + 70], y[start:start + 70])
+    blocks.update(x[:0], y[:0])
+
+    assert blocks.count == whole.count == len(y)
+    np.testing.assert_allclose(blocks.mean, x.mean(axis=0))
+    np.testing.assert_allclose(blocks.scale, x.std(axis=0))
+    np.testing.assert_allclose(blocks.solve_elastic_net(0.1, 0.5)[0],
+                               whole.solve_elastic_net(0.1, 0.5)[0], rtol=1e-9)
+
+
+def test_warm_start_from_the_previous_solution(regression):
+    x, y = regression
+    stats = GramStatistics(x.shape[1]).update(x[:300], y[:300])
+    previous, _, _ = stats.solve_elastic_net(0.1, 0.5, tol=1e-10, max_iter=100_000)
+
+    stats.update(x[300:], y[300:])
+    cold, cold_intercept, cold_iter = stats.solve_elastic_net(0.1, 0.5, tol=1e-10,
+                                                              max_iter=100_000)
+    warm, warm_intercept, warm_iter = stats.solve_elastic_net(
+        0.1, 0.5, coef_init=previous, tol=1e-10, max_iter=100_000)
+
+    np.testing.assert_allclose(warm, cold, rtol=1e-6, atol=1e-9)
+    assert warm_intercept == pytest.approx(cold_intercept, rel=1e-6)
+    assert warm_iter < cold_iter
+
+
+def test_save_and_load_round_trip(tmp_path, regression):
+    x, y = regression
+    stats = GramStatistics(x.shape[1]).update(x, y)
+    stats.save(tmp_path / "stats.npz")
+    loaded = GramStatistics.load(tmp_path / "stats.npz")
+
+    assert loaded.count == stats.count
+    for name in ("shift", "x_sum", "xtx", "xty"):
+        np.testing.assert_array_equal(getattr(loaded, name), getattr(stats, name))
+    assert (loaded.y_shift, loaded.y_sum) == (stats.y_shift, stats.y_sum)
+    np.testing.assert_array_equal(loaded.solve_elastic_net(0.1, 0.5)[0],
+                                  stats.solve_elastic_net(0.1, 0.5)[0])
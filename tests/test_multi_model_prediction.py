@@ -0,0 +1,84 @@
+import os
+from pathlib import Path
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+import yaml
+from box import ConfigBox
+from sklearn.linear_model import ElasticNet
+from ml_project.config.configuration import ConfigurationManager
+from ml_project.entity.config_entity import ServingConfig
+from ml_project.pipeline.multi_model_prediction import load_multi_model_pipeline
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+COLUMNS = ["a", "b"]
+
+
+def _serving_config_manager(tmp_path, monkeypatch, models):
+    monkeypatch.chdir(tmp_path)
+    with open(ROOT_DIR / "config" / "config.yaml", encoding="utf-8") as f:
+        config = yaml.safe_load(f)
+    config["serving"]["models"] = models
+    with open(tmp_path / "config.yaml", "w", encoding="utf-8") as f:
+        yaml.safe_dump(config, f)
+    return ConfigurationManager(tmp_path / "config.yaml", ROOT_DIR / "params.yaml",
+                                ROOT_DIR / "schema.yaml")
+
+
+@pytest.mark.parametrize("weights", [(0.0, 1.0), (None, 0.5), (1.0, -0.5)])
+def test_serving_config_rejects_a_primary_without_traffic(tmp_path, monkeypatch, weights):
+    models = [{"name": f"m{i}", "path": f"m{i}.joblib"} for i in range(2)]
+    for model, weight in zip(models, weights):
+        if weight is not None:
+            model["weight"] = weight
+    with pytest.raises(ValueError):
+        _serving_config_manager(tmp_path, monkeypatch, models).get_serving_config()
+
+
+@pytest.mark.parametrize("weights", [(None, None), (1.0, 0.0), (0.9, 0.1)])
+def test_serving_config_accepts_a_served_primary(tmp_path, monkeypatch, weights):
+    models = [{"name": f"m{i}", "path": f"m{i}.joblib"} for i in range(2)]
+    for model, weight in zip(models, weights):
+        if weight is not None:
+            model["weight"] = weight
+    config = _serving_config_manager(tmp_path, monkeypatch, models).get_serving_config()
+    assert [model.name for model in config.models] == ["m0", "m1"]
+
+
+def _save_model(path, coef):
+    x = pd.DataFrame(np.random.default_rng(0).normal(size=(50, 2)), columns=COLUMNS)
+    joblib.dump(ElasticNet(alpha=1e-6).fit(x, x.to_numpy() @ np.asarray(coef)), path)
+
+
+def _serving_config(tmp_path, weights):
+    models = [ConfigBox({"name": f"m{i}", "path": str(tmp_path / f"m{i}.joblib"),
+                         "weight": weight}) for i, weight in enumerate(weights)]
+    return ServingConfig(models=models, feature_columns=COLUMNS, queue_size=10,
+                         shadow_report_interval=1.0)
+
+
+def test_pipelines_are_cached_per_model_list(tmp_path):
+    _save_model(tmp_path / "m0.joblib", [1.0, 0.0])
+    _save_model(tmp_path / "m1.joblib", [0.0, 1.0])
+
+    first = load_multi_model_pipeline(_serving_config(tmp_path, [1.0, 0.0]))
+    assert load_multi_model_pipeline(_serving_config(tmp_path, [1.0, 0.0])) is first
+    other = load_multi_model_pipeline(_serving_config(tmp_path, [0.5, 0.5]))
+    assert other is not first
+    np.testing.assert_allclose(other.weights, [0.5, 0.5])
+    np.testing.assert_allclose(first.weights, [1.0, 0.0])
+
+
+def test_a_retrained_model_rebuilds_the_pipeline(tmp_path):
+    _save_model(tmp_path / "m0.joblib", [1.0, 0.0])
+    config = _serving_config(tmp_path, [1.0])
+    before = load_multi_model_pipeline(config)
+    _save_model(tmp_path / "m0.joblib", [0.0, 2.0])
+    stat = os.stat(tmp_path / "m0.joblib")
+    os.utime(tmp_path / "m0.joblib", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    after = load_multi_model_pipeline(config)
+    assert after is not before
+    prediction, _, _ = after.predict(np.array([[1.0, 1.0]]))
+    np.testing.assert_allclose(prediction, [2.0], atol=1e-3)
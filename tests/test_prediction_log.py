@@ -0,0 +1,42 @@
+import threading
+import numpy as np
+from ml_project.components.prediction_log import PredictionLogger, read_prediction_logs
+from ml_project.entity.config_entity import PredictionLogConfig
+
+
+def _config(tmp_path, queue_size=1000):
+    return PredictionLogConfig(root_dir=tmp_path, n_features=3, max_file_bytes=1 << 20,
+                               batch_size=16, flush_interval=0.01, queue_size=queue_size,
+                               replay_report_file=tmp_path / "replay_report.json")
+
+
+def test_logged_predictions_are_read_back_in_order(tmp_path):
+    prediction_log = PredictionLogger(_config(tmp_path)).start()
+    rng = np.random.default_rng(0)
+    features = rng.normal(size=(100, 3))
+    for start in range(0, 100, 10):
+        prediction_log.log(features[start:start + 10], features[start:start + 10].sum(axis=1),
+                           "v1" if start < 50 else np.array([b"v2"] * 10))
+    prediction_log.stop()
+
+    records = np.concatenate(list(read_prediction_logs(tmp_path, chunk_rows=7)))
+    np.testing.assert_array_equal(records["features"], features)
+    np.testing.assert_array_equal(records["prediction"], features.sum(axis=1))
+    assert records["model_version"].tolist() == [b"v1"] * 50 + [b"v2"] * 50
+    assert prediction_log.dropped == 0
+
+
+def test_records_beyond_a_full_queue_are_counted_as_dropped(tmp_path):
+    # the writer is not started, so the queue fills up after `queue_size` records
+    prediction_log = PredictionLogger(_config(tmp_path, queue_size=10))
+
+    def log_many():
+        for _ in range(2000):
+            prediction_log.log(np.zeros((1, 3)), [0.0], "v1")
+
+    threads = [threading.Thread(target=log_many) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert prediction_log.dropped == 8 * 2000 - 10
@@ -0,0 +1,50 @@
+import tracemalloc
+import pytest
+from ml_project.entity.config_entity import ProfilingConfig
+from ml_project.utils import profiling
+from ml_project.utils.profiling import Profiler
+
+
+@pytest.fixture
+def config(tmp_path):
+    return ProfilingConfig(root_dir=tmp_path, sample_interval=0.001, top_n=5)
+
+
+def _work():
+    return sum(len(str(i)) for i in range(200_000))
+
+
+def test_profiler_writes_its_reports(config):
+    with Profiler("Data Transformation Stage", config) as profiler:
+        _work()
+    assert profiler.active
+    assert profiler.name.startswith("data-transformation-stage-")
+    for suffix in (".prof", ".txt", ".collapsed", ".allocations.txt"):
+        assert (config.root_dir / f"{profiler.name}{suffix}").exists()
+    allocations = (config.root_dir / f"{profiler.name}.allocations.txt").read_text()
+    assert allocations.startswith("peak traced memory above start:")
+    assert not tracemalloc.is_tracing()
+
+
+def test_only_one_profile_runs_at_a_time(config):
+    with Profiler("outer", config) as outer:
+        with Profiler("inner", config) as inner:
+            _work()
+    assert outer.active and not inner.active
+    assert not list(config.root_dir.glob("inner-*"))
+
+
+def test_failed_setup_does_not_block_later_profiles(config, monkeypatch):
+    def fail():
+        raise MemoryError("no memory for a snapshot")
+
+    monkeypatch.setattr(profiling.tracemalloc, "take_snapshot", fail)
+    with pytest.raises(MemoryError):
+        with Profiler("failing", config):
+            pass
+    assert not tracemalloc.is_tracing()
+    monkeypatch.undo()
+
+    with Profiler("next", config) as profiler:
+        _work()
+    assert profiler.active
@@ -0,0 +1,90 @@
+import io
+import numpy as np
+import pandas as pd
+from ml_project.utils.row_hashing import HashSet, in_test_split, row_hashes
+
+
+def test_row_hashes_are_pinned():
+    # a change here moves rows between the train and test splits of existing artifacts
+    frame = pd.DataFrame({"a": [1.0, 0.0, np.nan], "b": [2.5, -1.0, 3.0]})
+    assert row_hashes(frame, ["a", "b"]).tolist() == [
+        17974823119052514736, 3816314549212305516, 17307576120856230695]
+
+
+def test_row_hashes_compare_values_as_numbers():
+    text = "a,b\n1,2.50\n-0.0,1e0\nnan,3\n"
+    parsed = pd.read_csv(io.StringIO(text))
+    other_nan = np.array([0x7FF8000000000001], dtype=np.uint64).view(np.float64)[0]
+    typed = pd.DataFrame({"a": [1.0, 0.0, other_nan], "b": [2.5, 1.0, 3.0]})
+    np.testing.assert_array_equal(row_hashes(parsed, ["a", "b"]), row_hashes(typed, ["a", "b"]))
+
+
+def test_row_hashes_depend_on_the_key_columns_only(make_wine_frame):
+    data = make_wine_frame(n_rows=50)
+    features = list(data.columns[:-1])
+    relabelled = data.assign(quality=data["quality"] + 1)
+    np.testing.assert_array_equal(row_hashes(data, features), row_hashes(relabelled, features))
+    assert len(np.unique(row_hashes(data, features))) == len(data)
+
+
+def test_row_hashes_do_not_depend_on_chunking(make_wine_frame):
+    data = make_wine_frame(n_rows=300)
+    features = list(data.columns[:-1])
+    chunked = np.concatenate([row_hashes(data.iloc[i:i + 64], features)
+                              for i in range(0, len(data), 64)])
+    np.testing.assert_array_equal(chunked, row_hashes(data, features))
+
+
+def test_in_test_split_fraction_and_stability():
+    hashes = np.random.default_rng(0).integers(0, 2**63, 100_000, dtype=np.uint64)
+    in_test = in_test_split(hashes, 0.25)
+    assert abs(in_test.mean() - 0.25) < 0.01
+    np.testing.assert_array_equal(in_test_split(hashes.copy(), 0.25), in_test)
+    # growing the test size only moves rows from train to test
+    assert not (in_test & ~in_test_split(hashes, 0.3)).any()
+
+
+def test_hash_set_add_marks_first_occurrences():
+    hashes = HashSet()
+    is_new = hashes.add(np.array([5, 3, 5, 9], dtype=np.uint64))
+    assert is_new.tolist() == [True, True, False, True]
+    is_new = hashes.add(np.array([9, 1, 1, 7, 3], dtype=np.uint64))
+    assert is_new.tolist() == [False, True, False, True, False]
+    assert hashes.add(np.empty(0, dtype=np.uint64)).tolist() == []
+    assert len(hashes) == 5
+    assert hashes.hashes.dtype == np.uint64
+    assert hashes.hashes.tolist() == [1, 3, 5, 7, 9]
+
+
+def test_hash_set_matches_a_python_set():
+    rng = np.random.default_rng(1)
+    hashes, seen = HashSet(), set()
+    for _ in range(50):
+        block = rng.integers(0, 2_000, rng.integers(0, 200)).astype(np.uint64)
+        expected = []
+        for value in block.tolist():
+            expected.append(value not in seen)
+            seen.add(value)
+        assert hashes.add(block).tolist() == expected
+    assert hashes.hashes.tolist() == sorted(seen)
+
+
+def test_hash_set_save_and_load(tmp_path):
+    hashes = HashSet()
+    hashes.add(np.array([2**64 - 1, 0, 42], dtype=np.uint64))
+    hashes.save(tmp_path / "hashes.npy")
+    loaded = HashSet.load(tmp_path / "hashes.npy")
+    np.testing.assert_array_equal(loaded.hashes, hashes.hashes)
+    assert loaded.add(np.array([42, 43], dtype=np.uint64)).tolist() == [False, True]
+
+
+def test_hash_set_warns_once_when_it_grows_large(caplog):
+    hashes = HashSet()
+    hashes.warn_size = 4
+    with caplog.at_level("WARNING", logger="ml_project_logger"):
+        hashes.add(np.arange(3, dtype=np.uint64))
+        assert not caplog.records
+        hashes.add(np.arange(6, dtype=np.uint64))
+        hashes.add(np.arange(10, dtype=np.uint64))
+    assert len(caplog.records) == 1
+    assert "holds 6 distinct rows" in caplog.records[0].getMessage()
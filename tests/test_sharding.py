@@ -0,0 +1,94 @@
+import os
+import zipfile
+from pathlib import Path
+import numpy as np
+import pytest
+from ml_project.components.data_ingestion import DataIngestion
+from ml_project.components.data_transformation import DataTransformation
+from ml_project.entity.config_entity import DataIngestionConfig, DataTransformationConfig
+from ml_project.utils.common import save_json
+from ml_project.utils.sharding import load_shards, map_shards
+
+
+def _square(index, shard, offset):
+    return index, shard * shard + offset
+
+
+def _transformation(root, data_path, schema, duplicates, chunk_size=128):
+    os.makedirs(root, exist_ok=True)
+    return DataTransformation(DataTransformationConfig(
+        root_dir=root,
+        data_path=data_path,
+        delta_path=os.path.join(root, "delta.csv"),
+        state_path=os.path.join(root, "ingestion_state.json"),
+        pending_state_path=os.path.join(root, "ingestion_state.pending.json"),
+        train_delta_file=os.path.join(root, "train_delta.csv"),
+        test_size=0.25,
+        feature_stats_file=os.path.join(root, "feature_stats.json"),
+        chunk_size=chunk_size,
+        sample_size=1000,
+        n_bins=10,
+        target_column=schema.TARGET_COLUMN.name,
+        all_schema=dict(schema.COLUMNS),
+        duplicates=duplicates,
+        row_hashes_file=os.path.join(root, "row_hashes.npy"),
+        shards_file=os.path.join(root, "shards.json"),
+        partitions_dir=os.path.join(root, "partitions"),
+        n_jobs=2,
+    ))
+
+
+def test_load_shards_without_shard_list(tmp_path):
+    assert load_shards(tmp_path / "shards.json") is None
+
+
+def test_map_shards_keeps_shard_order():
+    assert map_shards(_square, [3, 1, 2], 2, 10) == [(0, 19), (1, 11), (2, 14)]
+
+
+def test_ingest_shards_keeps_sources_with_the_same_name_apart(tmp_path):
+    for name in ("a", "b"):
+        os.makedirs(tmp_path / name)
+        with zipfile.ZipFile(tmp_path / name / "data.zip", "w") as archive:
+            archive.writestr("data.csv", f"x,y\n1,{name}\n")
+    (tmp_path / "c.csv").write_text("x,y\n1,c\n")
+    root = tmp_path / "ingestion"
+    ingestion = DataIngestion(DataIngestionConfig(
+        root_dir=root, source_URL="", local_data_file="", download_state_file="",
+        unzip_dir="", data_file="", state_file="", pending_state_file="",
+        delta_file=str(root / "delta.csv"), incremental=False,
+        sources=[str(tmp_path / "*" / "data.zip"), str(tmp_path / "c.csv"),
+                 str(tmp_path / "missing-*.csv")],
+        shard_dir=str(root / "shards"), shards_file=str(root / "shards.json"), max_workers=3))
+
+    shards = ingestion.ingest_shards()
+
+    assert [Path(path).read_text().split()[1] for path in shards] == ["1,a", "1,b", "1,c"]
+    assert len(set(shards)) == 3
+    assert load_shards(root / "shards.json") == shards
+
+
+@pytest.mark.parametrize("duplicates", ["group", "drop"])
+def test_sharded_split_matches_single_file_split(tmp_path, schema, make_wine_frame,
+                                                 duplicates):
+    data = make_wine_frame(n_rows=900, n_duplicates=300)
+    single_path = tmp_path / "data.csv"
+    data.to_csv(single_path, index=False)
+    shard_paths = []
+    for i, start in enumerate(range(0, len(data), 300)):
+        shard_paths.append(str(tmp_path / f"shard-{i}.csv"))
+        data.iloc[start:start + 300].to_csv(shard_paths[-1], index=False)
+
+    single = _transformation(str(tmp_path / "single"), str(single_path), schema, duplicates)
+    single.train_test_spliting()
+    sharded = _transformation(str(tmp_path / "sharded"), "", schema, duplicates)
+    save_json(path=tmp_path / "sharded" / "shards.json", data={"shards": shard_paths})
+    sharded.split_shards()
+
+    for name in ("train.csv", "test.csv"):
+        with open(tmp_path / "single" / name, "rb") as expected, \
+                open(tmp_path / "sharded" / name, "rb") as actual:
+            assert actual.read() == expected.read()
+    if duplicates == "drop":
+        np.testing.assert_array_equal(np.load(tmp_path / "sharded" / "row_hashes.npy"),
+                                      np.load(tmp_path / "single" / "row_hashes.npy"))